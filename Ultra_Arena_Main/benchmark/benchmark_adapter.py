@@ -11,6 +11,25 @@ from pathlib import Path
 
 from .benchmark_manager import BenchmarkManager
 
+try:
+    from config import config_base as _config_base
+except Exception:
+    _config_base = None
+
+
+def _default_mandatory_keys() -> List[str]:
+    """
+    Get a copy of the configured MANDATORY_KEYS.
+    
+    The config module is imported once above, but the attribute is read on
+    every call because run profiles reassign config_base.MANDATORY_KEYS at
+    runtime.
+    
+    Returns:
+        List of mandatory keys (empty if the config is unavailable)
+    """
+    return list(getattr(_config_base, 'MANDATORY_KEYS', None) or [])
+
 
 class BenchmarkComparatorAdapter:
     """
@@ -125,11 +144,7 @@ def create_benchmark_manager(benchmark_file_path: str,
         Configured BenchmarkManager instance
     """
     if mandatory_keys is None:
-        try:
-            from config.config_base import MANDATORY_KEYS as _MANDATORY_KEYS
-            mandatory_keys = _MANDATORY_KEYS or []
-        except Exception:
-            mandatory_keys = []
+        mandatory_keys = _default_mandatory_keys()
     
     return BenchmarkManager(benchmark_file_path, mandatory_keys)
 
@@ -148,10 +163,6 @@ def create_benchmark_adapter(benchmark_file_path: str,
         Configured BenchmarkComparatorAdapter instance
     """
     if mandatory_keys is None:
-        try:
-            from config.config_base import MANDATORY_KEYS as _MANDATORY_KEYS
-            mandatory_keys = _MANDATORY_KEYS or []
-        except Exception:
-            mandatory_keys = []
+        mandatory_keys = _default_mandatory_keys()
     
     return BenchmarkComparatorAdapter(benchmark_file_path, mandatory_keys) 
\ No newline at end of file
@@ -5,14 +5,32 @@ This class provides a unified interface for all benchmark comparison operations
 including validation, error tracking, and reporting.
 """
 
+import csv
 import logging
-import pandas as pd
+import os
+import sys
+import tempfile
+from collections import Counter, OrderedDict
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 
 from .benchmark_validator import BenchmarkValidator
-from .benchmark_reporter import BenchmarkReporter
+from .benchmark_reporter import BenchmarkReporter, ERROR_CSV_FIELDS
+
+# Maximum number of recent per-file validation results kept for reuse
+VALIDATION_CACHE_SIZE = 4096
+
+# Batch size from which validate_batch_results compares all files in one
+# pandas merge; below it the per-file loop is faster
+VECTORIZED_VALIDATION_MIN_FILES = 1000
+
+
+def _copy_validation(validation_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a validation result down to its key lists and field error dicts."""
+    copied = {key: list(value) if isinstance(value, list) else value
+              for key, value in validation_result.items()}
+    copied['field_errors'] = [dict(field_error) for field_error in validation_result['field_errors']]
+    return copied
 
 
 class BenchmarkManager:
@@ -44,9 +62,17 @@ class BenchmarkManager:
         # Statistics tracking
         self.total_unmatched_fields = 0
         self.total_unmatched_files = 0
-        self.unmatched_fields_data = []
+        self.field_error_counts = Counter()
+        self.files_with_field_errors = set()
+        
+        # Unmatched field rows are streamed to a temporary CSV spool on first error
+        self._error_spool = None
+        self._error_writer = None
         
-        logging.info(f"🔍 Benchmark Manager initialized with {len(mandatory_keys)} mandatory keys")
+        # Recent validation results keyed by file path and compared values
+        self._validation_cache = OrderedDict()
+        
+        logging.info("🔍 Benchmark Manager initialized with %d mandatory keys", len(mandatory_keys))
     
     def validate_file_results(self, file_path: str, extracted_result: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -59,35 +85,149 @@ class BenchmarkManager:
         Returns:
             Dictionary containing validation results and statistics
         """
+        cache_key = self._validation_cache_key(file_path, extracted_result)
+        cached_result = self._validation_cache.get(cache_key) if cache_key is not None else None
+        if cached_result is not None:
+            # Identical extraction already validated: skip the comparison, but
+            # record it again so statistics and error rows match a fresh run
+            self._validation_cache.move_to_end(cache_key)
+            self._record_validation(file_path, cached_result)
+            # Callers may modify the result; the cached entry must stay intact
+            return _copy_validation(cached_result)
+        
         validation_result = self.validator.validate_single_file(file_path, extracted_result)
         
-        # Track statistics
+        if cache_key is not None:
+            self._validation_cache[cache_key] = _copy_validation(validation_result)
+            if len(self._validation_cache) > VALIDATION_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
+        
+        self._record_validation(file_path, validation_result)
+        return validation_result
+    
+    def _record_validation(self, file_path: str, validation_result: Dict[str, Any]):
+        """
+        Track statistics and spool field errors for a freshly validated file.
+        
+        Args:
+            file_path: Path to the processed file
+            validation_result: Result from BenchmarkValidator.validate_single_file
+        """
         if validation_result['has_errors']:
             self.total_unmatched_files += 1
             self.total_unmatched_fields += validation_result['unmatched_count']
             
-            # Add to unmatched fields data for CSV generation
-            for field_error in validation_result['field_errors']:
-                self.unmatched_fields_data.append({
-                    'file_path': file_path,
-                    'field_name': field_error['field_name'],
-                    'benchmark_value': field_error['benchmark_value'],
-                    'extracted_value': field_error['extracted_value'],
-                    'timestamp': datetime.now().isoformat()
-                })
+            # Stream unmatched fields to the error spool for CSV generation,
+            # one tuple per row in ERROR_CSV_FIELDS order, in a single call per file
+            field_errors = validation_result['field_errors']
+            if field_errors:
+                self._get_error_writer().writerows(
+                    (file_path, field_error['field_name'], field_error['benchmark_value'], field_error['extracted_value'])
+                    for field_error in field_errors
+                )
+                self.field_error_counts.update(field_error['field_name'] for field_error in field_errors)
+                self.files_with_field_errors.add(file_path)
+    
+    def _validation_cache_key(self, file_path: str, extracted_result: Any) -> Optional[Tuple]:
+        """
+        Build the validation cache key for an extracted result.
         
-        return validation_result
+        Only DOC_TYPE and the mandatory keys affect validation, so the key is
+        built from those values alone. Each value is tagged with its type and
+        repr, so None and "None" or 1 and "1" get different keys.
+        
+        Args:
+            file_path: Path to the processed file
+            extracted_result: Extracted data from the file
+            
+        Returns:
+            Hashable cache key, or None if the result is not cacheable
+        """
+        if not extracted_result or not isinstance(extracted_result, dict):
+            return None
+        
+        compared_values = tuple(
+            (key, type(value).__name__, repr(value))
+            for key, value in ((key, extracted_result.get(key)) for key in ('DOC_TYPE', *self.mandatory_keys))
+        )
+        return file_path, compared_values
+    
+    def _get_error_writer(self):
+        """
+        Get the CSV writer for the error spool, creating the spool on first use.
+        
+        Returns:
+            csv writer appending unmatched field row tuples to the spool file
+        """
+        if self._error_writer is None:
+            self._error_spool = tempfile.TemporaryFile(mode='w+', newline='', encoding='utf-8', suffix='.csv')
+            # '\n' like DataFrame.to_csv and the results CSV, not csv's default '\r\n'
+            self._error_writer = csv.writer(self._error_spool, lineterminator='\n')
+            self._error_writer.writerow(ERROR_CSV_FIELDS)
+        return self._error_writer
+    
+    def iter_unmatched_fields(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the unmatched field rows recorded so far.
+        
+        Rows are read back from the error spool, so memory use stays constant
+        regardless of how many errors were recorded.
+        
+        Yields:
+            Dictionary for each unmatched field
+        """
+        if self._error_spool is None:
+            return
+        
+        self._error_spool.flush()
+        self._error_spool.seek(0)
+        try:
+            for row in csv.DictReader(self._error_spool):
+                # CSV has no null; missing benchmark values are written as ''
+                row['benchmark_value'] = row['benchmark_value'] or None
+                # Paths and field names repeat across rows; share one copy of each
+                row['file_path'] = sys.intern(row['file_path'])
+                row['field_name'] = sys.intern(row['field_name'])
+                yield row
+        finally:
+            self._error_spool.seek(0, os.SEEK_END)
+    
+    @property
+    def unmatched_fields_data(self) -> List[Dict[str, Any]]:
+        """
+        Unmatched field rows materialized as a list (loaded on demand).
+        
+        The list is a snapshot of the error spool; appending to it records
+        nothing. Assign a new list to replace the recorded rows.
+        """
+        return list(self.iter_unmatched_fields())
+    
+    @unmatched_fields_data.setter
+    def unmatched_fields_data(self, rows: List[Dict[str, Any]]):
+        # Kept assignable as when this was a plain list attribute; columns
+        # outside ERROR_CSV_FIELDS are not spooled
+        self.close()
+        if rows:
+            self._get_error_writer().writerows(
+                tuple(row.get(field) for field in ERROR_CSV_FIELDS) for row in rows
+            )
     
     def validate_batch_results(self, file_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Validate results for multiple files against benchmark data.
         
+        Batches of VECTORIZED_VALIDATION_MIN_FILES or more files go through
+        validate_batch_results_vectorized, which returns the same results.
+        
         Args:
             file_results: Dictionary mapping file paths to extracted results
             
         Returns:
             Dictionary containing batch validation results and statistics
         """
+        if len(file_results) >= VECTORIZED_VALIDATION_MIN_FILES:
+            return self.validate_batch_results_vectorized(file_results)
+        
         batch_results = {
             'total_files': len(file_results),
             'files_with_errors': 0,
@@ -105,6 +245,36 @@ class BenchmarkManager:
         
         return batch_results
     
+    def validate_batch_results_vectorized(self, file_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Validate results for multiple files using a single pandas merge.
+        
+        Produces the same result structure and statistics as validate_batch_results,
+        but compares all (file, field) pairs in one vectorized pass against the
+        benchmark data instead of calling the validator once per file.
+        
+        Args:
+            file_results: Dictionary mapping file paths to extracted results
+            
+        Returns:
+            Dictionary containing batch validation results and statistics
+        """
+        batch_results = {
+            'total_files': len(file_results),
+            'files_with_errors': 0,
+            'total_unmatched_fields': 0,
+            'file_results': self.validator.validate_many(file_results)
+        }
+        
+        for file_path, file_validation in batch_results['file_results'].items():
+            self._record_validation(file_path, file_validation)
+            
+            if file_validation['has_errors']:
+                batch_results['files_with_errors'] += 1
+                batch_results['total_unmatched_fields'] += file_validation['unmatched_count']
+        
+        return batch_results
+    
     def get_benchmark_errors(self) -> Dict[str, Any]:
         """
         Get current benchmark error statistics.
@@ -114,7 +284,9 @@ class BenchmarkManager:
         """
         return {
             'total_unmatched_fields': self.total_unmatched_fields,
-            'total_unmatched_files': self.total_unmatched_files
+            'total_unmatched_files': self.total_unmatched_files,
+            'unique_files_with_errors': len(self.files_with_field_errors),
+            'field_error_breakdown': dict(self.field_error_counts)
         }
     
     def generate_error_csv(self, output_path: str) -> str:
@@ -127,16 +299,17 @@ class BenchmarkManager:
         Returns:
             Path to the generated CSV file
         """
-        if not self.unmatched_fields_data:
+        if self._error_spool is None:
             logging.info("📊 No benchmark errors to report")
             return None
         
+        self._error_spool.flush()
         csv_path = self.reporter.generate_error_csv(
-            self.unmatched_fields_data, 
+            self._error_spool, 
             output_path
         )
         
-        logging.info(f"💾 Error CSV file saved: {csv_path}")
+        logging.info("💾 Error CSV file saved: %s", csv_path)
         return csv_path
     
     def generate_benchmark_report(self, output_dir: str) -> Dict[str, str]:
@@ -151,20 +324,37 @@ class BenchmarkManager:
         """
         report_files = self.reporter.generate_comprehensive_report(
             benchmark_errors=self.get_benchmark_errors(),
-            unmatched_data=self.unmatched_fields_data,
-            output_dir=output_dir
+            unmatched_data=self.iter_unmatched_fields(),
+            output_dir=output_dir,
+            mandatory_key_count=len(self.mandatory_keys),
+            error_spool=self._error_spool
         )
         
-        logging.info(f"📊 Benchmark report generated: {report_files}")
+        logging.info("📊 Benchmark report generated: %s", report_files)
         return report_files
     
     def reset_statistics(self):
         """Reset all benchmark statistics."""
         self.total_unmatched_fields = 0
         self.total_unmatched_files = 0
-        self.unmatched_fields_data = []
+        self.field_error_counts = Counter()
+        self.files_with_field_errors = set()
+        self.close()
+        self._validation_cache.clear()
         logging.info("🔄 Benchmark statistics reset")
     
+    def close(self):
+        """Close and delete the error spool; recorded error rows are discarded."""
+        if self._error_spool is not None:
+            self._error_spool.close()
+        self._error_spool = None
+        self._error_writer = None
+    
+    def __del__(self):
+        # The spool is a temporary file; release it with the manager
+        if getattr(self, '_error_spool', None) is not None:
+            self.close()
+    
     def get_benchmark_value(self, file_path: str, field_name: str) -> Optional[str]:
         """
         Get benchmark value for a specific file and field.
@@ -5,13 +5,101 @@ This class handles the generation of benchmark comparison reports,
 error CSV files, and statistical summaries.
 """
 
+import csv
+import functools
+import itertools
 import logging
-import pandas as pd
 import json
+import os
+import shutil
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, List, Optional, TextIO, Iterable, Tuple, Union
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Column layout of unmatched field rows in error CSV files
+ERROR_CSV_FIELDS = ['file_path', 'field_name', 'benchmark_value', 'extracted_value']
+
+
+def _encode_json(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Encode an object as UTF-8 JSON, using orjson when it is installed.
+    
+    Args:
+        obj: Object to encode
+        pretty: Indent the output by two spaces
+        
+    Returns:
+        Encoded JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=16)
+def _ensure_dir(path: str) -> Path:
+    """
+    Create a report directory once; later calls for the same path skip the mkdir.
+    
+    Args:
+        path: Directory path
+        
+    Returns:
+        Directory as a Path
+    """
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _open_report_file(path: Path, mode: str, **kwargs):
+    """
+    Open a report file for writing, recreating its directory if it was removed.
+    
+    _ensure_dir skips the mkdir for directories it has already created, so a
+    directory deleted or rotated since then is created again here.
+    
+    Args:
+        path: Report file path
+        mode: File mode passed to open()
+        **kwargs: Further arguments passed to open()
+        
+    Returns:
+        Open file object
+    """
+    try:
+        return open(path, mode, **kwargs)
+    except FileNotFoundError:
+        _ensure_dir.cache_clear()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        return open(path, mode, **kwargs)
+
+
+def _dump_json(obj: Any, path: Path, pretty: bool = False):
+    """
+    Write an object to a JSON file in binary mode.
+    
+    Pretty printing is only worth it for small files such as the summary;
+    large reports should be written compact.
+    
+    Args:
+        obj: Object to write
+        path: Destination file path
+        pretty: Indent the output by two spaces
+    """
+    with _open_report_file(path, 'wb') as f:
+        f.write(_encode_json(obj, pretty=pretty))
+
 
 class BenchmarkReporter:
     """
@@ -27,156 +115,214 @@ class BenchmarkReporter:
         """Initialize the benchmark reporter."""
         pass
     
-    def generate_error_csv(self, unmatched_data: List[Dict[str, Any]], output_path: str) -> str:
+    def generate_error_csv(self, unmatched_data: Union[TextIO, List[Dict[str, Any]], None], output_path: str) -> str:
         """
         Generate CSV file with detailed error information.
         
         Args:
-            unmatched_data: List of unmatched field data
+            unmatched_data: Open CSV spool file holding the unmatched field rows,
+                or a list of unmatched field dicts as accepted before the spool
             output_path: Base path for the CSV file
             
         Returns:
             Path to the generated CSV file
         """
-        if not unmatched_data:
+        if unmatched_data is None or (isinstance(unmatched_data, list) and not unmatched_data):
             return None
         
         # Create errors directory
         output_path = Path(output_path)
-        errors_dir = output_path.parent / 'errors'
-        errors_dir.mkdir(parents=True, exist_ok=True)
+        errors_dir = _ensure_dir(str(output_path.parent / 'errors'))
         
         # Generate error CSV filename
         csv_filename = output_path.name
         error_csv_filename = f"errors_{csv_filename}"
         error_csv_path = errors_dir / error_csv_filename
         
-        # Create DataFrame and save to CSV
-        df_errors = pd.DataFrame(unmatched_data)
-        df_errors.to_csv(error_csv_path, index=False)
+        if isinstance(unmatched_data, list):
+            import pandas as pd
+            with _open_report_file(error_csv_path, 'w', newline='', encoding='utf-8') as f:
+                pd.DataFrame(unmatched_data).to_csv(f, index=False, lineterminator='\n')
+        else:
+            self._copy_error_spool(unmatched_data, error_csv_path)
         
-        logging.info(f"💾 Error CSV file saved: {error_csv_path}")
+        logging.info("💾 Error CSV file saved: %s", error_csv_path)
         return str(error_csv_path)
     
+    def _copy_error_spool(self, error_spool: TextIO, csv_path: Path):
+        """
+        Copy the spooled error rows into a CSV file as-is, no re-encoding needed.
+        
+        Args:
+            error_spool: Open CSV spool file holding the unmatched field rows
+            csv_path: Destination CSV file path
+        """
+        error_spool.seek(0)
+        try:
+            with _open_report_file(csv_path, 'w', newline='', encoding='utf-8') as f:
+                shutil.copyfileobj(error_spool, f)
+        finally:
+            error_spool.seek(0, os.SEEK_END)
+    
     def generate_comprehensive_report(self, benchmark_errors: Dict[str, Any], 
-                                   unmatched_data: List[Dict[str, Any]], 
-                                   output_dir: str) -> Dict[str, str]:
+                                   unmatched_data: Iterable[Dict[str, Any]], 
+                                   output_dir: str,
+                                   mandatory_key_count: int = 5,
+                                   error_spool: Optional[TextIO] = None) -> Dict[str, str]:
         """
         Generate comprehensive benchmark comparison report.
         
         Args:
             benchmark_errors: Dictionary containing error statistics
-            unmatched_data: List of unmatched field data
+            unmatched_data: Iterable of unmatched field rows (traversed once)
             output_dir: Directory to save report files
+            mandatory_key_count: Number of mandatory keys validated per file
+            error_spool: CSV spool backing unmatched_data; when given, the CSV
+                report is a byte copy of it instead of re-encoding every row
             
         Returns:
             Dictionary containing paths to generated report files
         """
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        output_path = _ensure_dir(str(output_dir))
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_time = datetime.now()
+        timestamp = report_time.strftime("%Y%m%d_%H%M%S")
         report_files = {}
         
-        # Generate summary report
-        summary_report = self._generate_summary_report(benchmark_errors, unmatched_data)
+        # Peek so the CSV is only created when there are errors to report
+        rows = iter(unmatched_data)
+        first_row = next(rows, None)
+        
+        if first_row is not None and error_spool is not None:
+            csv_path = output_path / f"benchmark_errors_{timestamp}.csv"
+            summary_report, error_report = self._single_pass_reports(
+                benchmark_errors, itertools.chain([first_row], rows), None,
+                report_time.isoformat(), mandatory_key_count
+            )
+            # Copy only after the pass, since unmatched_data reads the same spool
+            self._copy_error_spool(error_spool, csv_path)
+        elif first_row is not None:
+            csv_path = output_path / f"benchmark_errors_{timestamp}.csv"
+            with _open_report_file(csv_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=ERROR_CSV_FIELDS, lineterminator='\n')
+                writer.writeheader()
+                summary_report, error_report = self._single_pass_reports(
+                    benchmark_errors, itertools.chain([first_row], rows), writer,
+                    report_time.isoformat(), mandatory_key_count
+                )
+        else:
+            summary_report, error_report = self._single_pass_reports(
+                benchmark_errors, [], None, report_time.isoformat(), mandatory_key_count
+            )
+        
+        # Save summary report
         summary_path = output_path / f"benchmark_summary_{timestamp}.json"
         
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(summary_report, f, indent=2, ensure_ascii=False)
+        _dump_json(summary_report, summary_path, pretty=True)
         
         report_files['summary'] = str(summary_path)
         
-        # Generate detailed error report
-        if unmatched_data:
-            error_report = self._generate_detailed_error_report(unmatched_data)
+        # Save detailed error report
+        if first_row is not None:
             error_path = output_path / f"benchmark_errors_{timestamp}.json"
-            
-            with open(error_path, 'w', encoding='utf-8') as f:
-                json.dump(error_report, f, indent=2, ensure_ascii=False)
-            
+            self._write_error_report(error_report, error_path)
             report_files['errors'] = str(error_path)
-        
-        # Generate CSV report
-        if unmatched_data:
-            csv_path = output_path / f"benchmark_errors_{timestamp}.csv"
-            df_errors = pd.DataFrame(unmatched_data)
-            df_errors.to_csv(csv_path, index=False)
             report_files['csv'] = str(csv_path)
         
         return report_files
     
-    def _generate_summary_report(self, benchmark_errors: Dict[str, Any], 
-                               unmatched_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _single_pass_reports(self, benchmark_errors: Dict[str, Any],
+                             unmatched_data: Iterable[Dict[str, Any]],
+                             csv_writer: Optional[csv.DictWriter],
+                             report_timestamp: str,
+                             mandatory_key_count: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
-        Generate summary report with key statistics.
+        Build the summary and detailed error reports in one pass over the errors.
+        
+        Each unmatched field row is counted, grouped by file and written to the
+        CSV writer as it is visited, so the data is traversed only once.
         
         Args:
             benchmark_errors: Dictionary containing error statistics
-            unmatched_data: List of unmatched field data
+            unmatched_data: Iterable of unmatched field rows
+            csv_writer: Writer receiving every row, or None to skip CSV output
+            report_timestamp: ISO timestamp shared by both reports
+            mandatory_key_count: Number of mandatory keys validated per file
             
         Returns:
-            Dictionary containing summary statistics
+            Tuple of (summary report, detailed error report)
         """
-        # Calculate additional statistics
-        unique_files = set()
-        field_error_counts = {}
+        field_error_counts = Counter()
+        file_errors = defaultdict(list)
+        total_errors = 0
         
         for error in unmatched_data:
-            unique_files.add(error['file_path'])
+            total_errors += 1
             field_name = error['field_name']
-            field_error_counts[field_name] = field_error_counts.get(field_name, 0) + 1
+            field_error_counts[field_name] += 1
+            
+            file_errors[error['file_path']].append({
+                'field_name': field_name,
+                'benchmark_value': error['benchmark_value'],
+                'extracted_value': error['extracted_value']
+            })
+            
+            if csv_writer is not None:
+                csv_writer.writerow(error)
         
         summary = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': report_timestamp,
             'total_unmatched_fields': benchmark_errors.get('total_unmatched_fields', 0),
             'total_unmatched_files': benchmark_errors.get('total_unmatched_files', 0),
-            'unique_files_with_errors': len(unique_files),
-            'field_error_breakdown': field_error_counts,
-            'error_rate_percentage': self._calculate_error_rate(benchmark_errors, unmatched_data)
+            'unique_files_with_errors': len(file_errors),
+            'field_error_breakdown': dict(field_error_counts),
+            'error_rate_percentage': self._calculate_error_rate(
+                benchmark_errors, len(file_errors), mandatory_key_count
+            )
         }
         
-        return summary
+        error_report = {
+            'timestamp': report_timestamp,
+            'total_errors': total_errors,
+            'files_with_errors': len(file_errors),
+            'file_error_details': dict(file_errors)
+        }
+        
+        return summary, error_report
     
-    def _generate_detailed_error_report(self, unmatched_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _write_error_report(self, error_report: Dict[str, Any], error_path: Path):
         """
-        Generate detailed error report with file-level breakdown.
+        Write the detailed error report as compact JSON, streaming file_error_details.
+        
+        Each file's error list is encoded and written separately, so the whole
+        report is never held in memory as one serialized buffer.
         
         Args:
-            unmatched_data: List of unmatched field data
-            
-        Returns:
-            Dictionary containing detailed error information
+            error_report: Detailed error report from _single_pass_reports
+            error_path: Path of the JSON file to write
         """
-        file_errors = {}
-        
-        for error in unmatched_data:
-            file_path = error['file_path']
-            if file_path not in file_errors:
-                file_errors[file_path] = []
+        with _open_report_file(error_path, 'wb') as f:
+            f.write(b'{')
+            for key, value in error_report.items():
+                if key != 'file_error_details':
+                    f.write(_encode_json(key) + b':' + _encode_json(value) + b',')
             
-            file_errors[file_path].append({
-                'field_name': error['field_name'],
-                'benchmark_value': error['benchmark_value'],
-                'extracted_value': error['extracted_value'],
-                'timestamp': error.get('timestamp', '')
-            })
-        
-        return {
-            'timestamp': datetime.now().isoformat(),
-            'total_errors': len(unmatched_data),
-            'files_with_errors': len(file_errors),
-            'file_error_details': file_errors
-        }
+            f.write(b'"file_error_details":{')
+            separator = b''
+            for file_path, errors in error_report['file_error_details'].items():
+                f.write(separator + _encode_json(file_path) + b':' + _encode_json(errors))
+                separator = b','
+            f.write(b'}}')
     
     def _calculate_error_rate(self, benchmark_errors: Dict[str, Any], 
-                            unmatched_data: List[Dict[str, Any]]) -> float:
+                            unique_files_count: int, n_mandatory: int) -> float:
         """
         Calculate error rate percentage.
         
         Args:
             benchmark_errors: Dictionary containing error statistics
-            unmatched_data: List of unmatched field data
+            unique_files_count: Number of distinct files with field errors
+            n_mandatory: Number of mandatory keys validated per file
             
         Returns:
             Error rate as a percentage
@@ -185,8 +331,8 @@ class BenchmarkReporter:
         if total_fields == 0:
             return 0.0
         
-        # Estimate total fields (assuming 5 mandatory keys per file)
-        estimated_total_fields = len(set(error['file_path'] for error in unmatched_data)) * 5
+        # Estimate total fields from the mandatory keys checked per file
+        estimated_total_fields = unique_files_count * n_mandatory
         
         if estimated_total_fields == 0:
             return 0.0
@@ -212,19 +358,21 @@ class BenchmarkReporter:
             'file_error_breakdown': {}
         }
         
+        field_error_counts = Counter()
+        
         for file_path, result in file_results.items():
             if result.get('has_errors', False):
                 stats['files_with_errors'] += 1
                 stats['total_errors'] += result.get('unmatched_count', 0)
                 
                 # Track field errors
-                for error in result.get('field_errors', []):
-                    field_name = error['field_name']
-                    stats['field_error_breakdown'][field_name] = stats['field_error_breakdown'].get(field_name, 0) + 1
+                field_error_counts.update(error['field_name'] for error in result.get('field_errors', []))
                 
                 # Track file errors
                 stats['file_error_breakdown'][file_path] = result.get('unmatched_count', 0)
         
+        stats['field_error_breakdown'] = dict(field_error_counts)
+        
         # Calculate error rate
         if stats['total_files'] > 0:
             stats['error_rate'] = (stats['files_with_errors'] / stats['total_files']) * 100
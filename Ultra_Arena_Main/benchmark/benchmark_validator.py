@@ -7,8 +7,27 @@ including mandatory key checking and value comparison.
 
 import logging
 import pandas as pd
-from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Tuple, Mapping
+
+from common.benchmark_index import BenchmarkIndex, is_null, values_match
+
+
+def _is_plain_value(value: Any) -> bool:
+    """
+    Check whether an extracted value compares the same in validate_many as in validate_single_file.
+    
+    NaN counts as present per file but as missing for isna(), and containers
+    cannot go through isin(), so only None, str, int, bool and non-NaN floats
+    are compared column-wise.
+    
+    Args:
+        value: Extracted value of a mandatory key
+        
+    Returns:
+        True if the value can be validated in the vectorized pass
+    """
+    return value is None or type(value) in (str, int, bool) or (type(value) is float and value == value)
 
 
 class BenchmarkValidator:
@@ -21,41 +40,42 @@ class BenchmarkValidator:
     - Mandatory key validation with benchmark comparison
     """
     
-    def __init__(self, benchmark_file_path: str, mandatory_keys: List[str]):
+    def __init__(self, benchmark_file_path: str, mandatory_keys: List[str],
+                 benchmark_index: Optional[BenchmarkIndex] = None):
         """
         Initialize the benchmark validator.
         
         Args:
             benchmark_file_path: Path to the benchmark Excel file
             mandatory_keys: List of mandatory keys to validate
+            benchmark_index: Already loaded index to share, loaded from
+                benchmark_file_path if not given
         """
         self.benchmark_file_path = benchmark_file_path
         self.mandatory_keys = mandatory_keys
-        self.benchmark_data = None
         
         # Load benchmark data
-        self._load_benchmark_data()
+        self.benchmark_index = benchmark_index or BenchmarkIndex.from_file(benchmark_file_path)
+        self.benchmark_data = self.benchmark_index.benchmark_data
+        
+        # Mandatory keys that have a benchmark column, resolved once
+        self._benchmark_keys = frozenset(key for key in mandatory_keys if key in self.benchmark_index.columns)
         
         logging.info(f"🔍 Benchmark Validator initialized with {len(mandatory_keys)} mandatory keys")
     
-    def _load_benchmark_data(self):
-        """Load benchmark data from CSV or Excel file."""
-        try:
-            # Determine file type and load accordingly
-            if self.benchmark_file_path.lower().endswith('.csv'):
-                self.benchmark_data = pd.read_csv(self.benchmark_file_path)
-            elif self.benchmark_file_path.lower().endswith(('.xlsx', '.xls')):
-                self.benchmark_data = pd.read_excel(self.benchmark_file_path)
-            else:
-                # Default to CSV
-                self.benchmark_data = pd.read_csv(self.benchmark_file_path)
-                
-            logging.info(f"📊 Loaded benchmark data: {len(self.benchmark_data)} records")
-        except Exception as e:
-            logging.error(f"❌ Failed to load benchmark data: {e}")
-            self.benchmark_data = pd.DataFrame()
+    def _find_benchmark_row(self, file_path: str) -> Optional[int]:
+        """
+        Find the position of the benchmark record for a given file path.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Position of the record in the benchmark data or None if not found
+        """
+        return self.benchmark_index.find_row(file_path)
     
-    def _find_benchmark_record(self, file_path: str) -> Optional[pd.Series]:
+    def _find_benchmark_record(self, file_path: str) -> Optional[Mapping[str, Any]]:
         """
         Find benchmark record for a given file path.
         
@@ -63,34 +83,9 @@ class BenchmarkValidator:
             file_path: Path to the file
             
         Returns:
-            Benchmark record as pandas Series or None if not found
-        """
-        if self.benchmark_data.empty:
-            return None
-        
-        # Extract filename from path
-        filename = Path(file_path).name
-        
-        # Try to find match in file_path column (for CSV format)
-        if 'file_path' in self.benchmark_data.columns:
-            # Look for the filename within the file_path values
-            for _, record in self.benchmark_data.iterrows():
-                benchmark_file_path = str(record.get('file_path', ''))
-                if filename in benchmark_file_path:
-                    return record
-        
-        # Fallback: Try to find exact match in filename column (for legacy Excel format)
-        if 'filename' in self.benchmark_data.columns:
-            match = self.benchmark_data[self.benchmark_data['filename'] == filename]
-            if not match.empty:
-                return match.iloc[0]
-        
-        # Fallback: Try partial match if exact match fails
-        for _, record in self.benchmark_data.iterrows():
-            if filename in str(record.get('filename', '')):
-                return record
-        
-        return None
+            Benchmark record as a read-only dict or None if not found
+        """
+        return self.benchmark_index.find(file_path)
     
     def get_benchmark_value(self, file_path: str, field_name: str) -> Optional[str]:
         """
@@ -103,11 +98,7 @@ class BenchmarkValidator:
         Returns:
             Benchmark value or None if not found
         """
-        record = self._find_benchmark_record(file_path)
-        if record is not None and field_name in record:
-            value = record[field_name]
-            return str(value) if pd.notna(value) else None
-        return None
+        return self.benchmark_index.value(file_path, field_name)
     
     def _values_match(self, value1: Any, value2: Any) -> bool:
         """
@@ -120,17 +111,7 @@ class BenchmarkValidator:
         Returns:
             True if values match, False otherwise
         """
-        # Handle None/null cases
-        if pd.isna(value1) and pd.isna(value2):
-            return True
-        if pd.isna(value1) or pd.isna(value2):
-            return False
-        
-        # Convert to strings for comparison (handles different data types)
-        str1 = str(value1).strip()
-        str2 = str(value2).strip()
-        
-        return str1 == str2
+        return values_match(value1, value2)
     
     def validate_single_file(self, file_path: str, extracted_result: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -167,7 +148,8 @@ class BenchmarkValidator:
             }
         
         # Find benchmark record
-        benchmark_record = self._find_benchmark_record(file_path)
+        position = self._find_benchmark_row(file_path)
+        stripped_record = self.benchmark_index.stripped_records[position] if position is not None else None
         
         missing_keys = []
         present_keys = []
@@ -186,13 +168,20 @@ class BenchmarkValidator:
             present_keys.append(key)
             
             # Compare with benchmark if available
-            if benchmark_record is not None and key in benchmark_record:
-                benchmark_value = benchmark_record[key]
-                benchmark_str = str(benchmark_value) if pd.notna(benchmark_value) else None
+            if stripped_record is not None and key in self._benchmark_keys:
+                # Benchmark side was stripped at load time; only strip the extracted value
+                benchmark_stripped = stripped_record[key]
+                if benchmark_stripped is None:
+                    is_match = is_null(extracted_value)
+                else:
+                    extracted_str = extracted_value if type(extracted_value) is str else str(extracted_value)
+                    is_match = not is_null(extracted_value) and extracted_str.strip() == benchmark_stripped
                 
-                if self._values_match(extracted_value, benchmark_str):
+                if is_match:
                     matching_keys.append(key)
                 else:
+                    benchmark_value = self.benchmark_index.records[position][key]
+                    benchmark_str = str(benchmark_value) if not is_null(benchmark_value) else None
                     non_matching_keys.append(key)
                     field_errors.append({
                         'field_name': key,
@@ -210,17 +199,19 @@ class BenchmarkValidator:
         
         # Log validation results
         if matching_keys:
-            logging.info(f"🎯 Some present key values match benchmark: {matching_keys}")
+            logging.info("🎯 Some present key values match benchmark: %s", matching_keys)
         
         if non_matching_keys:
-            logging.warning(f"⚠️ Some present key values don't match benchmark: {non_matching_keys}")
+            logging.warning("⚠️ Some present key values don't match benchmark: %s", non_matching_keys)
             
-            # Log specific mismatches
-            for error in field_errors:
-                logging.info(f"🔍 Value mismatch for {error['field_name']}: benchmark='{error['benchmark_value']}' vs extracted='{error['extracted_value']}'")
+            # Log specific mismatches, skipping the loop entirely when INFO is off
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                for error in field_errors:
+                    logging.info("🔍 Value mismatch for %s: benchmark='%s' vs extracted='%s'",
+                                 error['field_name'], error['benchmark_value'], error['extracted_value'])
         
         if missing_keys:
-            logging.warning(f"⚠️ Missing mandatory keys: {missing_keys}. Present keys: {present_keys}")
+            logging.warning("⚠️ Missing mandatory keys: %s. Present keys: %s", missing_keys, present_keys)
         
         return {
             'has_errors': len(missing_keys) > 0 or len(non_matching_keys) > 0,
@@ -232,6 +223,107 @@ class BenchmarkValidator:
             'non_matching_keys': non_matching_keys
         }
     
+    def validate_many(self, file_results: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Validate extracted results for many files in one vectorized pass.
+        
+        All (file, key) pairs are merged against the benchmark data at once and
+        compared column-wise; the per-file results are then assembled from the
+        boolean masks. Each result is identical to validate_single_file's.
+        
+        Args:
+            file_results: Dictionary mapping file paths to extracted results
+            
+        Returns:
+            Dictionary mapping each file path to its validation result, in input order
+        """
+        validations = {}
+        
+        # Flatten (file, benchmark row, field, extracted value) records. Results
+        # that produce no records (empty, 'Outros', no mandatory keys) or hold
+        # values the column-wise checks treat differently keep the per-file path
+        records = []
+        for file_path, result in file_results.items():
+            if (not result or not isinstance(result, dict) or result.get('DOC_TYPE') == 'Outros'
+                    or not self.mandatory_keys
+                    or not all(_is_plain_value(result.get(key)) for key in self.mandatory_keys)):
+                validations[file_path] = self.validate_single_file(file_path, result)
+                continue
+            
+            row_label = self._find_benchmark_row(file_path)
+            if row_label is None:
+                row_label = -1
+            for key in self.mandatory_keys:
+                records.append((file_path, row_label, key, result.get(key)))
+        
+        if records:
+            # object dtype keeps each extracted value as given, so str() renders
+            # ints as '1' rather than the '1.0' of an inferred float column
+            ext_df = pd.DataFrame(
+                records, columns=['file_path', 'row_label', 'field_name', 'extracted_value'], dtype=object
+            )
+            
+            if self.benchmark_index.records:
+                # Long-format benchmark values keyed by (row position, field_name); object
+                # dtype keeps melt from upcasting integer columns to float
+                benchmark_keys = [key for key in self.mandatory_keys if key in self._benchmark_keys]
+                bench_df = (self.benchmark_data[benchmark_keys]
+                            .astype(object)
+                            .reset_index(drop=True)
+                            .rename_axis('row_label')
+                            .reset_index()
+                            .melt(id_vars='row_label', var_name='field_name', value_name='benchmark_value'))
+                merged = ext_df.merge(bench_df, on=['row_label', 'field_name'], how='left')
+            else:
+                # No benchmark loaded: every present field is non-matching
+                merged = ext_df.assign(benchmark_value=None)
+            
+            extracted = merged['extracted_value']
+            has_benchmark = merged['benchmark_value'].notna()
+            missing = extracted.isna() | extracted.isin(["", "Not found"])
+            matching = (~missing & has_benchmark &
+                        (extracted.astype(str).str.strip() == merged['benchmark_value'].astype(str).str.strip()))
+            non_matching = ~missing & ~matching
+            
+            merged['benchmark_value'] = merged['benchmark_value'].astype(str).astype(object).mask(~has_benchmark, None)
+            merged['extracted_value'] = extracted.astype(str)
+            
+            def keys_by_file(mask):
+                return merged.loc[mask].groupby('file_path', sort=False)['field_name'].agg(list).to_dict()
+            
+            missing_by_file = keys_by_file(missing)
+            present_by_file = keys_by_file(~missing)
+            matching_by_file = keys_by_file(matching)
+            non_matching_by_file = keys_by_file(non_matching)
+            
+            errors = merged.loc[non_matching, ['file_path', 'field_name', 'benchmark_value', 'extracted_value']]
+            # Convert the error rows once, then group them by file in plain Python
+            errors_by_file = defaultdict(list)
+            for file_path, field_name, benchmark_value, extracted_value in errors.itertuples(index=False, name=None):
+                errors_by_file[file_path].append({
+                    'field_name': field_name,
+                    'benchmark_value': benchmark_value,
+                    'extracted_value': extracted_value
+                })
+            
+            for file_path in ext_df['file_path'].unique():
+                missing_keys = missing_by_file.get(file_path, [])
+                non_matching_keys = non_matching_by_file.get(file_path, [])
+                validations[file_path] = {
+                    'has_errors': len(missing_keys) > 0 or len(non_matching_keys) > 0,
+                    'unmatched_count': len(missing_keys) + len(non_matching_keys),
+                    'field_errors': errors_by_file.get(file_path, []),
+                    'missing_keys': missing_keys,
+                    'present_keys': present_by_file.get(file_path, []),
+                    'matching_keys': matching_by_file.get(file_path, []),
+                    'non_matching_keys': non_matching_keys
+                }
+            
+            logging.info("🔍 Vectorized validation: %d non-matching and %d missing fields across %d files",
+                         int(non_matching.sum()), int(missing.sum()), len(errors_by_file))
+        
+        return {file_path: validations[file_path] for file_path in file_results}
+    
     def check_mandatory_keys_with_benchmark(self, result: Dict[str, Any], file_path: str) -> Tuple[bool, List[str]]:
         """
         Check mandatory keys with benchmark comparison (legacy interface).
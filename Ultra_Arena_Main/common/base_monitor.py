@@ -15,7 +15,7 @@ class BasePerformanceMonitor:
     def __init__(self, mode: str):
         self.start_time = time.time()
         self.mode = mode
-        self.metrics = {
+        metrics = {
             'files_processed': 0,
             'files_successful': 0,
             'files_failed': 0,
@@ -33,57 +33,85 @@ class BasePerformanceMonitor:
             'files_deleted': 0,
             'storage_saved_mb': 0.0
         }
+        # Counters and sample lists live in separate dicts, each with its own
+        # lock, so update() dispatches by membership instead of type checks
+        self._scalar_metrics = {key: value for key, value in metrics.items() if not isinstance(value, list)}
+        self._list_metrics = {key: value for key, value in metrics.items() if isinstance(value, list)}
         self.lock = threading.Lock()
+        self._list_lock = threading.Lock()
+        
+        # Derived metrics refreshed after their source counter changes
+        self._post_update = {
+            'current_workers': self._update_peak_workers,
+            'input_tokens': self._recompute_total_tokens,
+            'output_tokens': self._recompute_total_tokens,
+        }
         self.progress_callback = None
     
+    def _update_peak_workers(self, value):
+        """Track peak workers; called with the counter lock held."""
+        if value > self._scalar_metrics['peak_workers']:
+            self._scalar_metrics['peak_workers'] = value
+    
+    def _recompute_total_tokens(self, value):
+        """Update total tokens from input/output tokens; called with the counter lock held."""
+        self._scalar_metrics['total_tokens'] = self._scalar_metrics['input_tokens'] + self._scalar_metrics['output_tokens']
+    
     def update(self, **kwargs):
         """Thread-safe metric update."""
-        with self.lock:
-            for key, value in kwargs.items():
-                if key in self.metrics:
-                    if isinstance(self.metrics[key], list):
-                        self.metrics[key].append(value)
-                    else:
-                        self.metrics[key] += value
-                        
-                        # Track peak workers
-                        if key == 'current_workers':
-                            self.metrics['peak_workers'] = max(self.metrics['peak_workers'], value)
-                        
-                        # Update total tokens when input/output tokens are updated
-                        if key in ['input_tokens', 'output_tokens']:
-                            self.metrics['total_tokens'] = self.metrics['input_tokens'] + self.metrics['output_tokens']
+        list_updates = [(key, value) for key, value in kwargs.items() if key in self._list_metrics]
+        counter_updates = [(key, value) for key, value in kwargs.items() if key in self._scalar_metrics]
+        
+        if list_updates:
+            with self._list_lock:
+                for key, value in list_updates:
+                    self._list_metrics[key].append(value)
+        
+        if counter_updates:
+            with self.lock:
+                for key, value in counter_updates:
+                    self._scalar_metrics[key] += value
+                    post_update = self._post_update.get(key)
+                    if post_update is not None:
+                        post_update(value)
     
     def get_stats(self):
         """Get current statistics."""
+        # Snapshot under the locks, then compute outside them
+        with self._list_lock:
+            upload_times = list(self._list_metrics['upload_times'])
+            processing_times = list(self._list_metrics['processing_times'])
+            file_sizes = list(self._list_metrics['file_sizes'])
         with self.lock:
-            elapsed = time.time() - self.start_time
-            avg_upload = sum(self.metrics['upload_times']) / len(self.metrics['upload_times']) if self.metrics['upload_times'] else 0
-            avg_processing = sum(self.metrics['processing_times']) / len(self.metrics['processing_times']) if self.metrics['processing_times'] else 0
-            avg_file_size = sum(self.metrics['file_sizes']) / len(self.metrics['file_sizes']) if self.metrics['file_sizes'] else 0
-            
-            return {
-                'mode': self.mode,
-                'files_processed': self.metrics['files_processed'],
-                'files_successful': self.metrics['files_successful'],
-                'files_failed': self.metrics['files_failed'],
-                'files_retried': self.metrics['files_retried'],
-                'elapsed_time': elapsed,
-                'files_per_second': self.metrics['files_processed'] / elapsed if elapsed > 0 else 0,
-                'avg_upload_time': avg_upload,
-                'avg_processing_time': avg_processing,
-                'avg_file_size_mb': avg_file_size,
-                'total_tokens': self.metrics['total_tokens'],
-                'input_tokens': self.metrics['input_tokens'],
-                'output_tokens': self.metrics['output_tokens'],
-                'error_rate': self.metrics['files_failed'] / max(self.metrics['files_processed'], 1),
-                'success_rate': self.metrics['files_successful'] / max(self.metrics['files_processed'], 1),
-                'api_calls': self.metrics['api_calls'],
-                'peak_workers': self.metrics['peak_workers'],
-                'total_file_size_mb': sum(self.metrics['file_sizes']),
-                'files_deleted': self.metrics['files_deleted'],
-                'storage_saved_mb': self.metrics['storage_saved_mb']
-            }
+            metrics = dict(self._scalar_metrics)
+        
+        elapsed = time.time() - self.start_time
+        avg_upload = sum(upload_times) / len(upload_times) if upload_times else 0
+        avg_processing = sum(processing_times) / len(processing_times) if processing_times else 0
+        avg_file_size = sum(file_sizes) / len(file_sizes) if file_sizes else 0
+        
+        return {
+            'mode': self.mode,
+            'files_processed': metrics['files_processed'],
+            'files_successful': metrics['files_successful'],
+            'files_failed': metrics['files_failed'],
+            'files_retried': metrics['files_retried'],
+            'elapsed_time': elapsed,
+            'files_per_second': metrics['files_processed'] / elapsed if elapsed > 0 else 0,
+            'avg_upload_time': avg_upload,
+            'avg_processing_time': avg_processing,
+            'avg_file_size_mb': avg_file_size,
+            'total_tokens': metrics['total_tokens'],
+            'input_tokens': metrics['input_tokens'],
+            'output_tokens': metrics['output_tokens'],
+            'error_rate': metrics['files_failed'] / max(metrics['files_processed'], 1),
+            'success_rate': metrics['files_successful'] / max(metrics['files_processed'], 1),
+            'api_calls': metrics['api_calls'],
+            'peak_workers': metrics['peak_workers'],
+            'total_file_size_mb': sum(file_sizes),
+            'files_deleted': metrics['files_deleted'],
+            'storage_saved_mb': metrics['storage_saved_mb']
+        }
     
     def log_progress(self, message: str, level: str = "INFO"):
         """Log progress with timestamp."""
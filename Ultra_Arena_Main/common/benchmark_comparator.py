@@ -10,46 +10,35 @@ import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from config.config_base import BENCHMARK_FILE_PATH, MANDATORY_KEYS
+from common.benchmark_index import BenchmarkIndex, normalize_filename, values_match
 
 
 class BenchmarkComparator:
     """Handles benchmark comparison functionality."""
     
-    def __init__(self, benchmark_file_path: str = BENCHMARK_FILE_PATH):
+    def __init__(self, benchmark_file_path: str = BENCHMARK_FILE_PATH,
+                 benchmark_index: Optional[BenchmarkIndex] = None):
         """Initialize the benchmark comparator.
         
         Args:
             benchmark_file_path: Path to the benchmark Excel file
+            benchmark_index: Already loaded index to share, loaded from
+                benchmark_file_path if not given
         """
         self.benchmark_file_path = benchmark_file_path
-        self.df_benchmark = None
         self.df_unmatched = []
+        self._unmatched_df_cache = None
+        self._unmatched_df_dirty = True
         self.total_unmatched_fields = 0
         self.total_unmatched_files = 0
         self.processed_files = set()
         
         # Load benchmark data
-        self._load_benchmark_data()
-    
-    def _load_benchmark_data(self) -> None:
-        """Load benchmark data from CSV file."""
-        try:
+        if benchmark_index is None:
             logging.info(f"📊 Loading benchmark data from: {self.benchmark_file_path}")
-            
-            # Determine file type and load accordingly
-            if self.benchmark_file_path.lower().endswith('.csv'):
-                self.df_benchmark = pd.read_csv(self.benchmark_file_path)
-            elif self.benchmark_file_path.lower().endswith(('.xlsx', '.xls')):
-                self.df_benchmark = pd.read_excel(self.benchmark_file_path)
-            else:
-                # Default to CSV
-                self.df_benchmark = pd.read_csv(self.benchmark_file_path)
-                
-            logging.info(f"✅ Loaded benchmark data with {len(self.df_benchmark)} records")
-            logging.info(f"📋 Benchmark columns: {list(self.df_benchmark.columns)}")
-        except Exception as e:
-            logging.error(f"❌ Failed to load benchmark data: {e}")
-            self.df_benchmark = pd.DataFrame()
+            benchmark_index = BenchmarkIndex.from_file(benchmark_file_path)
+        self.benchmark_index = benchmark_index
+        self.df_benchmark = benchmark_index.benchmark_data
     
     def compare_file_result(self, file_path: str, processed_result: Dict) -> None:
         """Compare a processed file result against benchmark data.
@@ -58,12 +47,12 @@ class BenchmarkComparator:
             file_path: Path to the processed file
             processed_result: Dictionary containing the processed result
         """
-        if self.df_benchmark.empty:
+        if not self.benchmark_index.records:
             logging.warning("⚠️ No benchmark data available for comparison")
             return
         
         # Extract filename from file path for matching
-        filename = Path(file_path).name
+        filename = normalize_filename(file_path)
         
         # Find matching benchmark record
         benchmark_record = self._find_benchmark_record(filename)
@@ -90,13 +79,14 @@ class BenchmarkComparator:
                     'processed_value': processed_value
                 }
                 self.df_unmatched.append(mismatch_record)
+                self._unmatched_df_dirty = True
                 
                 # Increment counters
                 self.total_unmatched_fields += 1
                 file_has_mismatches = True
                 
-                logging.info(f"🔍 Mismatch found in {filename} - {key}: "
-                           f"benchmark='{benchmark_value}' vs processed='{processed_value}'")
+                logging.info("🔍 Mismatch found in %s - %s: benchmark='%s' vs processed='%s'",
+                             filename, key, benchmark_value, processed_value)
         
         # Increment file counter if any mismatches found
         if file_has_mismatches and file_path not in self.processed_files:
@@ -112,31 +102,7 @@ class BenchmarkComparator:
         Returns:
             Dictionary containing benchmark data or None if not found
         """
-        # Try to find match in file_path column (for CSV format)
-        if 'file_path' in self.df_benchmark.columns:
-            # Look for the filename within the file_path values
-            for _, record in self.df_benchmark.iterrows():
-                benchmark_file_path = str(record.get('file_path', ''))
-                if filename in benchmark_file_path:
-                    return record.to_dict()
-        
-        # Fallback: Try to find by filename column (common column names for legacy Excel format)
-        possible_filename_columns = ['filename', 'file_name', 'file', 'path']
-        
-        for col in possible_filename_columns:
-            if col in self.df_benchmark.columns:
-                matches = self.df_benchmark[self.df_benchmark[col] == filename]
-                if not matches.empty:
-                    return matches.iloc[0].to_dict()
-        
-        # If no exact match found, try partial matching
-        for col in possible_filename_columns:
-            if col in self.df_benchmark.columns:
-                matches = self.df_benchmark[self.df_benchmark[col].str.contains(filename, na=False)]
-                if not matches.empty:
-                    return matches.iloc[0].to_dict()
-        
-        return None
+        return self.benchmark_index.find(filename)
     
     def _values_match(self, value1, value2) -> bool:
         """Compare two values for equality, handling None/null cases.
@@ -148,17 +114,7 @@ class BenchmarkComparator:
         Returns:
             True if values match, False otherwise
         """
-        # Handle None/null cases
-        if pd.isna(value1) and pd.isna(value2):
-            return True
-        if pd.isna(value1) or pd.isna(value2):
-            return False
-        
-        # Convert to strings for comparison (handles different data types)
-        str1 = str(value1).strip()
-        str2 = str(value2).strip()
-        
-        return str1 == str2
+        return values_match(value1, value2)
     
     def get_benchmark_value(self, file_path: str, field_name: str) -> Optional[str]:
         """Get benchmark value for a specific file and field.
@@ -170,25 +126,7 @@ class BenchmarkComparator:
         Returns:
             Benchmark value for the field or None if not found
         """
-        if self.df_benchmark.empty:
-            return None
-        
-        # Extract filename from file path for matching
-        filename = Path(file_path).name
-        
-        # Find matching benchmark record
-        benchmark_record = self._find_benchmark_record(filename)
-        if benchmark_record is None:
-            return None
-        
-        # Get the benchmark value for the field
-        benchmark_value = benchmark_record.get(field_name)
-        
-        # Convert to string and handle None/null cases
-        if pd.isna(benchmark_value):
-            return None
-        
-        return str(benchmark_value).strip()
+        return self.benchmark_index.value(file_path, field_name, stripped=True)
     
     def get_benchmark_errors(self) -> Dict:
         """Get benchmark error statistics.
@@ -210,7 +148,12 @@ class BenchmarkComparator:
         if not self.df_unmatched:
             return pd.DataFrame()
         
-        return pd.DataFrame(self.df_unmatched)
+        # Rebuild only when new mismatches were recorded since the last call
+        if self._unmatched_df_dirty:
+            self._unmatched_df_cache = pd.DataFrame(self.df_unmatched)
+            self._unmatched_df_dirty = False
+        
+        return self._unmatched_df_cache
     
     def save_unmatched_to_csv(self, csv_file_path: str) -> None:
         """Save unmatched data to CSV file.
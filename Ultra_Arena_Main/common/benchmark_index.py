@@ -0,0 +1,306 @@
+"""
+Shared benchmark index used by the benchmark validator and comparator.
+
+This module loads a benchmark CSV or Excel file once, converts its rows to
+read-only records and indexes them by filename, so lookups are a dict hit
+instead of a scan over the DataFrame.
+"""
+
+import datetime
+import functools
+import logging
+import os
+import pandas as pd
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+# Common filename column names in legacy Excel benchmark files
+LEGACY_FILENAME_COLUMNS = ['filename', 'file_name', 'file', 'path']
+
+
+def is_null(value: Any) -> bool:
+    """Scalar null check treating None, NA, NaN and NaT as null, like pd.isna.
+    
+    Args:
+        value: Value to check
+    
+    Returns:
+        True if the value is null, False otherwise
+    """
+    return value is None or value is pd.NA or value is pd.NaT or (isinstance(value, float) and value != value)
+
+
+def values_match(value1: Any, value2: Any) -> bool:
+    """Compare two values for equality, handling None/null cases.
+    
+    Args:
+        value1: First value to compare
+        value2: Second value to compare
+    
+    Returns:
+        True if values match, False otherwise
+    """
+    # Handle None/null cases
+    null1 = is_null(value1)
+    null2 = is_null(value2)
+    if null1 or null2:
+        return null1 and null2
+    
+    # Fast path for two strings: equal strings match without stripping
+    if type(value1) is str and type(value2) is str:
+        return value1 == value2 or value1.strip() == value2.strip()
+    
+    # Convert to strings for comparison (handles different data types)
+    return str(value1).strip() == str(value2).strip()
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_filename(file_path: str) -> str:
+    """Reduce a file path to the filename used as benchmark index key.
+    
+    Cached because the same path is looked up once per mandatory key. Splits
+    on the last '/' or '\\' directly instead of building a Path object.
+    
+    Args:
+        file_path: Path to the file
+    
+    Returns:
+        Filename component of the path
+    """
+    return file_path[max(file_path.rfind('/'), file_path.rfind('\\')) + 1:]
+
+
+def _excel_cell_value(value: Any) -> Any:
+    """Convert a raw .xlsx cell value the way pandas' Excel readers do.
+    
+    Empty cells become '' and integral floats become int, so the parsed
+    columns get the same dtypes as with pandas.read_excel.
+    
+    Args:
+        value: Cell value from calamine or openpyxl
+    
+    Returns:
+        Converted cell value
+    """
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+        return datetime.datetime(value.year, value.month, value.day)
+    return value
+
+
+def _load_benchmark_fast(path: str) -> pd.DataFrame:
+    """Load an .xlsx benchmark workbook without going through pandas.read_excel.
+    
+    Uses python-calamine when it is installed, otherwise streams the first
+    sheet with openpyxl in read-only mode. The rows then go through the same
+    TextParser step as pandas.read_excel, so numeric-looking text such as
+    '11' or ' 22 ' is inferred exactly as read_excel would.
+    
+    Args:
+        path: Path to the .xlsx benchmark file
+    
+    Returns:
+        Benchmark data as a DataFrame
+    """
+    try:
+        from python_calamine import CalamineWorkbook
+        sheet = CalamineWorkbook.from_path(path).get_sheet_by_index(0)
+        rows = [[_excel_cell_value(cell) for cell in row] for row in sheet.to_python(skip_empty_area=False)]
+    except ImportError:
+        from openpyxl import load_workbook
+        from openpyxl.cell.cell import TYPE_ERROR
+        workbook = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+        try:
+            sheet = workbook.active
+            # Stored dimensions can be stale; read every row like read_excel does
+            sheet.reset_dimensions()
+            rows = [[float('nan') if cell.data_type == TYPE_ERROR else _excel_cell_value(cell.value) for cell in row]
+                    for row in sheet.rows]
+        finally:
+            workbook.close()
+    
+    # Trim trailing empty cells and rows, then pad to a rectangle
+    for row in rows:
+        while row and row[-1] == '':
+            row.pop()
+    while rows and not rows[-1]:
+        rows.pop()
+    if not rows:
+        return pd.DataFrame()
+    width = max(len(row) for row in rows)
+    rows = [row + [''] * (width - len(row)) for row in rows]
+    
+    try:
+        return TextParser(rows, header=0, skip_blank_lines=False).read()
+    except EmptyDataError:
+        return pd.DataFrame()
+
+
+def read_benchmark_file(path: str) -> pd.DataFrame:
+    """Read a benchmark CSV or Excel file into a DataFrame.
+    
+    Args:
+        path: Path to the benchmark file
+    
+    Returns:
+        Benchmark data as a DataFrame
+    """
+    # Determine file type once and load accordingly
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.xlsx':
+        return _load_benchmark_fast(path)
+    elif extension == '.xls':
+        return pd.read_excel(path)
+    
+    # CSV, also the default for unknown extensions
+    return pd.read_csv(path)
+
+
+class BenchmarkIndex:
+    """Benchmark rows as read-only records, indexed by filename.
+    
+    One index can be shared by any number of validators and comparators;
+    use from_file to reuse the parse of an unchanged benchmark file.
+    """
+    
+    def __init__(self, benchmark_data: Optional[pd.DataFrame] = None):
+        """Build the index from loaded benchmark data.
+        
+        Args:
+            benchmark_data: Loaded benchmark DataFrame, or None for an empty index
+        """
+        # benchmark_data stays None when nothing was loaded; empty records are
+        # the sentinel every lookup checks first
+        self.benchmark_data = benchmark_data
+        self.columns = frozenset(benchmark_data.columns) if benchmark_data is not None else frozenset()
+        self.records: Tuple[Mapping[str, Any], ...] = ()
+        self.stripped_records: Tuple[Mapping[str, Optional[str]], ...] = ()
+        self.by_filename: Mapping[str, int] = MappingProxyType({})
+        self._name_columns: Dict[str, Tuple[str, ...]] = {}
+        
+        if benchmark_data is not None and len(benchmark_data):
+            self._build()
+    
+    def _build(self) -> None:
+        """Convert rows to records and index them by file_path basename, then legacy filename columns."""
+        self.records = tuple(MappingProxyType(record) for record in self.benchmark_data.to_dict('records'))
+        # Benchmark values are invariant, so stringify and strip them once here
+        # rather than on every comparison
+        self.stripped_records = tuple(
+            MappingProxyType({field: str(value).strip() if not is_null(value) else None
+                              for field, value in record.items()})
+            for record in self.records
+        )
+        
+        by_filename = {}
+        for col in ['file_path'] + LEGACY_FILENAME_COLUMNS:
+            if col not in self.columns:
+                continue
+            # Plain strings, converted once; empty for null cells so they never match
+            names = tuple(value if isinstance(value, str) else '' for value in self.benchmark_data[col].to_numpy(dtype=object))
+            self._name_columns[col] = names
+            for position, name in enumerate(names):
+                if name:
+                    # First matching record wins, as in the partial-match fallback
+                    by_filename.setdefault(normalize_filename(name), position)
+        
+        self.by_filename = MappingProxyType(by_filename)
+    
+    @classmethod
+    def from_file(cls, benchmark_file_path: str) -> 'BenchmarkIndex':
+        """Load and index a benchmark file, reusing the index while the file is unchanged.
+        
+        Args:
+            benchmark_file_path: Path to the benchmark CSV or Excel file
+        
+        Returns:
+            Benchmark index; empty if the file could not be loaded
+        """
+        try:
+            index = _load_index_cached(benchmark_file_path, os.path.getmtime(benchmark_file_path))
+            logging.info(f"📊 Loaded benchmark data: {len(index.records)} records")
+            return index
+        except Exception as e:
+            logging.error(f"❌ Failed to load benchmark data: {e}")
+            return cls()
+    
+    def find_row(self, file_path: str) -> Optional[int]:
+        """Find the position of the benchmark record for a file.
+        
+        Exact filenames are resolved through the index; only names missing
+        from it fall back to partial matching on the filename columns.
+        
+        Args:
+            file_path: Path or name of the file
+        
+        Returns:
+            Position of the record in the benchmark data or None if not found
+        """
+        if not self.records:
+            return None
+        
+        filename = normalize_filename(file_path)
+        position = self.by_filename.get(filename)
+        if position is not None:
+            return position
+        
+        # Fallback: Look for the filename within file_path, then legacy filename columns
+        for names in self._name_columns.values():
+            for position, name in enumerate(names):
+                if filename in name:
+                    return position
+        
+        return None
+    
+    def find(self, file_path: str) -> Optional[Mapping[str, Any]]:
+        """Find the benchmark record for a file.
+        
+        Args:
+            file_path: Path or name of the file
+        
+        Returns:
+            Benchmark record as a read-only dict or None if not found
+        """
+        position = self.find_row(file_path)
+        return self.records[position] if position is not None else None
+    
+    def value(self, file_path: str, field_name: str, stripped: bool = False) -> Optional[str]:
+        """Get the benchmark value of a field for a file.
+        
+        Args:
+            file_path: Path or name of the file
+            field_name: Name of the field
+            stripped: Return the value with surrounding whitespace stripped
+        
+        Returns:
+            Benchmark value as a string or None if not found or null
+        """
+        position = self.find_row(file_path)
+        if position is None:
+            return None
+        if stripped:
+            return self.stripped_records[position].get(field_name)
+        value = self.records[position].get(field_name)
+        return str(value) if not is_null(value) else None
+
+
+@functools.lru_cache(maxsize=4)
+def _load_index_cached(path: str, mtime: float) -> BenchmarkIndex:
+    """Load and index a benchmark file once per (path, modification time).
+    
+    A new mtime misses the cache, so edits to the file are picked up.
+    
+    Args:
+        path: Path to the benchmark file
+        mtime: Modification time of the file, used as part of the cache key
+    
+    Returns:
+        Benchmark index for the file
+    """
+    return BenchmarkIndex(read_benchmark_file(path))
@@ -8,18 +8,91 @@ timestamped directory structure for results.
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, List
 from datetime import datetime
 
 from .request_id_generator import RequestIDGenerator
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Parameter group keys that name a strategy's result files
+_STRATEGY_PARAM_KEYS = ("strategy", "mode", "provider", "model")
+
+# Characters of a model ID that are replaced by '_' in result filenames
+_MODEL_CLEAN_TABLE = str.maketrans({':': '_', '/': '_', '-': '_'})
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """
+    Write data as two-space indented JSON, using orjson when it is installed.
+    
+    Args:
+        path: Destination file path
+        data: Data to serialize
+    """
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
 
 class ComboMetaManager:
     """Manages combo meta files and directory structure."""
     
+    # Initial stats of a strategy result file that are the same for every strategy
+    # group. Read-only and shared between groups; json/orjson only read them.
+    _STATIC_STATS = MappingProxyType({
+        "retry_stats": {
+            "num_files_may_need_retry": 0,
+            "num_files_had_retry": 0,
+            "percentage_files_had_retry": 0.0,
+            "num_file_failed_after_max_retries": 0,
+            "actual_tokens_for_retries": 0,
+            "retry_prompt_tokens": 0,
+            "retry_candidate_tokens": 0,
+            "retry_other_tokens": 0,
+            "retry_total_tokens": 0
+        },
+        "overall_stats": {
+            "total_files": 0,
+            "total_estimated_tokens": 0,
+            "total_wall_time_in_sec": 0.0,
+            "total_group_wall_time_in_sec": 0.0,
+            "total_prompt_tokens": 0,
+            "total_candidate_tokens": 0,
+            "total_other_tokens": 0,
+            "total_actual_tokens": 0,
+            "average_prompt_tokens_per_file": 0.0,
+            "average_candidate_tokens_per_file": 0.0,
+            "average_other_tokens_per_file": 0.0,
+            "average_total_tokens_per_file": 0.0
+        },
+        "benchmark_errors": {
+            "total_unmatched_fields": 0,
+            "total_unmatched_files": 0
+        },
+        "overall_cost": {
+            "price_obtained_date": "",
+            "prompt_token_price_per_1M": 0.0,
+            "candidate_token_price_per_1M": 0.0,
+            "other_token_price_per_1M": 0.0,
+            "total_prompt_token_cost": 0.0,
+            "total_candidate_token_cost": 0.0,
+            "total_other_token_cost": 0.0,
+            "total_token_cost": 0.0
+        }
+    })
+    
     @staticmethod
     def create_results_directory(output_base_dir: str, request_id: str) -> Path:
         """
@@ -32,13 +105,43 @@ class ComboMetaManager:
         Returns:
             Path: Path to the created results directory
         """
-        timestamp = datetime.now().strftime("%y%m%d_%H%M%S")
-        results_dir = Path(f"{output_base_dir}/results_{timestamp}_{request_id}")
+        results_dir = ComboMetaManager._results_dir_path(output_base_dir, request_id)
         results_dir.mkdir(parents=True, exist_ok=True)
         
         logger.info(f"📁 Created results directory: {results_dir}")
         return results_dir
     
+    @staticmethod
+    def _results_dir_path(output_base_dir: str, request_id: str) -> Path:
+        """Path of the timestamped results directory for a request."""
+        timestamp = datetime.now().strftime("%y%m%d_%H%M%S")
+        return Path(f"{output_base_dir}/results_{timestamp}_{request_id}")
+    
+    @staticmethod
+    def create_combo_layout(output_base_dir: str, request_id: str) -> tuple[Path, Path, Path]:
+        """
+        Create the timestamped results directory with its csv and json subdirectories.
+        
+        Creating json with parents=True also creates the results directory, so
+        the whole layout takes two mkdir calls.
+        
+        Args:
+            output_base_dir: Base output directory
+            request_id: Unique request ID
+            
+        Returns:
+            tuple[Path, Path, Path]: Paths to the results, csv and json directories
+        """
+        results_dir = ComboMetaManager._results_dir_path(output_base_dir, request_id)
+        csv_dir = results_dir / "csv"
+        json_dir = results_dir / "json"
+        
+        json_dir.mkdir(parents=True, exist_ok=True)
+        csv_dir.mkdir(exist_ok=True)
+        
+        logger.info(f"📁 Created results directory: {results_dir}")
+        return results_dir, csv_dir, json_dir
+    
     @staticmethod
     def create_combo_meta_file(results_dir: Path, request_metadata: Dict[str, Any], 
                               combo_name: str, strategy_groups: List[str], 
@@ -68,8 +171,7 @@ class ComboMetaManager:
         }
         
         meta_file = results_dir / "combo_meta.json"
-        with open(meta_file, 'w') as f:
-            json.dump(meta_data, f, indent=2)
+        _write_json(meta_file, meta_data)
         
         logger.info(f"📄 Created combo_meta.json: {meta_file}")
         return meta_file
@@ -77,114 +179,89 @@ class ComboMetaManager:
     @staticmethod
     def initialize_strategy_files(json_dir: Path, csv_dir: Path, strategy_groups: List[str], param_grps: Dict = None) -> Dict[str, Dict[str, str]]:
         """
-        Pre-create detailed JSON and CSV files for all strategies with initial structure.
+        Pre-create detailed JSON files for all strategies with initial structure.
+        
+        Only the CSV filenames are reserved here; CSVResultDumper creates each
+        CSV file in csv_dir when it saves its first group of results.
         
         Args:
             json_dir: JSON directory path
-            csv_dir: CSV directory path
+            csv_dir: CSV directory path, which must already exist
             strategy_groups: List of strategy group names
             param_grps: Parameter groups dictionary to get strategy details
             
         Returns:
             Dict[str, Dict[str, str]]: Mapping of strategy group names to their generated filenames (json and csv)
         """
-        created_files = {}
-        
         # Use a single timestamp for all files to ensure consistency
-        from datetime import datetime
         timestamp = datetime.now().strftime("%m-%d-%H-%M-%S")
         
-        for strategy_group in strategy_groups:
-            # Get strategy parameters from param_grps
-            if param_grps and strategy_group in param_grps:
-                group_params = param_grps[strategy_group]
-                strategy = group_params.get("strategy", "unknown")
-                mode = group_params.get("mode", "unknown")
-                provider = group_params.get("provider", "unknown")
-                model = group_params.get("model", "unknown")
-            else:
-                # Fallback values if param_grps not available
-                strategy = "unknown"
-                mode = "unknown"
-                provider = "unknown"
-                model = "unknown"
-            
-            # Generate timestamped filenames (same format as actual result files)
-            clean_model = model.replace(":", "_").replace("/", "_").replace("-", "_")
-            json_filename = f"{strategy}_{mode}_{provider}_{clean_model}_{timestamp}.json"
-            csv_filename = f"{strategy}_{mode}_{provider}_{clean_model}_{timestamp}.csv"
-            
-            json_file = json_dir / json_filename
-            csv_file = csv_dir / csv_filename
-            
-            # Create detailed initial data structure matching actual result files
-            initial_data = {
-                "run_settings": {
-                    "strategy": strategy,
-                    "mode": mode,
-                    "llm_provider": provider,
-                    "llm_model": model
-                },
-                "file_stats": {},
-                "group_stats": {},
-                "retry_stats": {
-                    "num_files_may_need_retry": 0,
-                    "num_files_had_retry": 0,
-                    "percentage_files_had_retry": 0.0,
-                    "num_file_failed_after_max_retries": 0,
-                    "actual_tokens_for_retries": 0,
-                    "retry_prompt_tokens": 0,
-                    "retry_candidate_tokens": 0,
-                    "retry_other_tokens": 0,
-                    "retry_total_tokens": 0
-                },
-                "overall_stats": {
-                    "total_files": 0,
-                    "total_estimated_tokens": 0,
-                    "total_wall_time_in_sec": 0.0,
-                    "total_group_wall_time_in_sec": 0.0,
-                    "total_prompt_tokens": 0,
-                    "total_candidate_tokens": 0,
-                    "total_other_tokens": 0,
-                    "total_actual_tokens": 0,
-                    "average_prompt_tokens_per_file": 0.0,
-                    "average_candidate_tokens_per_file": 0.0,
-                    "average_other_tokens_per_file": 0.0,
-                    "average_total_tokens_per_file": 0.0
-                },
-                "benchmark_errors": {
-                    "total_unmatched_fields": 0,
-                    "total_unmatched_files": 0
-                },
-                "overall_cost": {
-                    "price_obtained_date": "",
-                    "prompt_token_price_per_1M": 0.0,
-                    "candidate_token_price_per_1M": 0.0,
-                    "other_token_price_per_1M": 0.0,
-                    "total_prompt_token_cost": 0.0,
-                    "total_candidate_token_cost": 0.0,
-                    "total_other_token_cost": 0.0,
-                    "total_token_cost": 0.0
-                }
-            }
-            
-            # Create JSON file
-            with open(json_file, 'w') as f:
-                json.dump(initial_data, f, indent=2)
-            
-            # Create empty CSV file (will be populated during processing)
-            with open(csv_file, 'w') as f:
-                f.write("")  # Empty file, will be populated during processing
-            
-            created_files[strategy_group] = {
-                "json": json_filename,
-                "csv": csv_filename
-            }
-            logger.debug(f"📄 Initialized strategy files: {json_file}, {csv_file}")
+        # Each group writes its own file, so independent groups are initialized in
+        # parallel; duplicates would write the same file and are done only once
+        unique_groups = list(dict.fromkeys(strategy_groups))
+        
+        def init_group(strategy_group: str) -> Dict[str, str]:
+            return ComboMetaManager._init_strategy_file(json_dir, strategy_group, param_grps, timestamp)
+        
+        if len(unique_groups) > 1:
+            with ThreadPoolExecutor(max_workers=min(16, len(unique_groups))) as executor:
+                filenames = list(executor.map(init_group, unique_groups))
+        else:
+            filenames = [init_group(strategy_group) for strategy_group in unique_groups]
+        
+        created_files = dict(zip(unique_groups, filenames))
         
-        logger.info(f"📄 Initialized {len(created_files)} strategy file pairs (JSON + CSV)")
+        logger.info(f"📄 Initialized {len(created_files)} strategy JSON files")
         return created_files
     
+    @staticmethod
+    def _init_strategy_file(json_dir: Path, strategy_group: str, param_grps: Dict, timestamp: str) -> Dict[str, str]:
+        """
+        Write the initial JSON file of one strategy group.
+        
+        Args:
+            json_dir: JSON directory path
+            strategy_group: Strategy group name
+            param_grps: Parameter groups dictionary to get strategy details
+            timestamp: Timestamp shared by all files of the combo
+            
+        Returns:
+            Dict[str, str]: Generated json and csv filenames of the group
+        """
+        # Get strategy parameters from param_grps, "unknown" if not available
+        group_params = (param_grps or {}).get(strategy_group) or {}
+        strategy, mode, provider, model = (group_params.get(key, "unknown") for key in _STRATEGY_PARAM_KEYS)
+        
+        # Generate timestamped filenames (same format as actual result files)
+        clean_model = model.translate(_MODEL_CLEAN_TABLE)
+        json_filename = f"{strategy}_{mode}_{provider}_{clean_model}_{timestamp}.json"
+        csv_filename = f"{strategy}_{mode}_{provider}_{clean_model}_{timestamp}.csv"
+        
+        json_file = json_dir / json_filename
+        
+        # Create detailed initial data structure matching actual result files;
+        # only run_settings differs between groups
+        initial_data = {
+            "run_settings": {
+                "strategy": strategy,
+                "mode": mode,
+                "llm_provider": provider,
+                "llm_model": model
+            },
+            "file_stats": {},
+            "group_stats": {},
+            **ComboMetaManager._STATIC_STATS
+        }
+        
+        # Create JSON file
+        _write_json(json_file, initial_data)
+        
+        logger.debug(f"📄 Initialized strategy file: {json_file} (CSV: {csv_filename})")
+        return {
+            "json": json_filename,
+            "csv": csv_filename
+        }
+    
     @staticmethod
     def create_combo_directories(results_dir: Path) -> tuple[Path, Path]:
         """
@@ -1,17 +1,173 @@
 import os
+import re
+import csv
+import functools
 import logging
 import hashlib
+import operator
 import pandas as pd
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
-# Import default output directory and mandatory keys
+# Import default output directory, mandatory keys and file hash algorithm
 try:
     from config.config_base import DEFAULT_OUTPUT_DIR, MANDATORY_KEYS
 except ImportError:
     DEFAULT_OUTPUT_DIR = "output/results/csv"
     MANDATORY_KEYS = []
 
+try:
+    from config.config_base import FILE_HASH_ALGO
+except ImportError:
+    FILE_HASH_ALGO = "md5"
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+
+def _resolve_file_hasher(algo: str):
+    """
+    Get the hash constructor for the file fingerprint column.
+    
+    Args:
+        algo: "md5", "blake3" or "xxh3_128"
+        
+    Returns:
+        Callable returning a hash object with update() and hexdigest()
+    """
+    if algo == "blake3" and BLAKE3_AVAILABLE:
+        return blake3.blake3
+    if algo == "xxh3_128" and XXHASH_AVAILABLE:
+        return xxhash.xxh3_128
+    if algo != "md5":
+        logging.warning(f"⚠️ File hash algorithm '{algo}' is not available, using md5")
+    return hashlib.md5
+
+
+# Mandatory keys worth validating, without empty and whitespace-only entries
+_MANDATORY_KEYS = tuple(key for key in MANDATORY_KEYS if key and key.strip())
+
+# Retry round encoded in retry group IDs, e.g. "..._retry_2_..."
+_RETRY_RE = re.compile(r'_retry_(\d+)(?:_|$)')
+
+# Extracted fields copied from the model output into every CSV row
+EXTRACT_FIELDS = ('file_name_llm', 'DOC_TYPE', 'CNPJ_1', 'CNPJ_2', 'VALOR_TOTAL', 'Chassi', 'CLAIM_NUMBER')
+_EMPTY_EXTRACTED_FIELDS = dict.fromkeys(EXTRACT_FIELDS, '')
+_ZERO_TOKEN_FIELDS = dict.fromkeys(
+    ('prompt_token_count', 'candidates_token_count', 'total_token_count', 'other_token_count'), 0
+)
+
+
+@dataclass
+class ResultRow:
+    """One file's row in the results CSV, fields in the column order of new/legacy results."""
+    file_path: str
+    file_name: str
+    group_id: str
+    success: bool
+    timestamp: str
+    retry_round: Optional[int]
+    file_size_mb: float
+    estimated_tokens: int
+    file_hash: str
+    modification_time: str
+    prompt_token_count: int
+    candidates_token_count: int
+    total_token_count: int
+    other_token_count: int
+    file_name_llm: Any
+    DOC_TYPE: Any
+    CNPJ_1: Any
+    CNPJ_2: Any
+    VALOR_TOTAL: Any
+    Chassi: Any
+    CLAIM_NUMBER: Any
+    file_group_ids_incl_retries: str
+
+
+# CSV columns; results in the direct structure list the group IDs before the token counts
+COLUMNS = tuple(field.name for field in fields(ResultRow))
+_DIRECT_COLUMNS = (
+    COLUMNS[:COLUMNS.index('modification_time') + 1]
+    + ('file_group_ids_incl_retries',)
+    + tuple(column for column in COLUMNS[COLUMNS.index('modification_time') + 1:] if column != 'file_group_ids_incl_retries')
+)
+
+
+def _result_shape(result: Dict[str, Any]) -> str:
+    """
+    Classify a result by structure.
+    
+    Args:
+        result: Result dictionary
+        
+    Returns:
+        'new' (file_model_output), 'legacy' (model_output) or 'direct' (extracted data)
+    """
+    if 'file_model_output' in result:
+        return 'new'
+    if 'model_output' in result:
+        return 'legacy'
+    return 'direct'
+
+
+def _extracted_fields(source: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy EXTRACT_FIELDS from a model output or result, defaulting to ''."""
+    return {key: source.get(key, '') for key in EXTRACT_FIELDS}
+
+
+def _token_fields(model_output: Dict[str, Any]) -> Dict[str, int]:
+    """Token count fields of a new-structure model output."""
+    prompt_tokens = model_output.get('prompt_token_count', 0)
+    candidates_tokens = model_output.get('candidates_token_count', 0)
+    total_tokens = model_output.get('total_token_count', 0)
+    return {
+        'prompt_token_count': prompt_tokens,
+        'candidates_token_count': candidates_tokens,
+        'total_token_count': total_tokens,
+        'other_token_count': total_tokens - prompt_tokens - candidates_tokens,
+    }
+
+
+# Fingerprint only, not an integrity check, so any fast hash will do
+_file_hasher = _resolve_file_hasher(FILE_HASH_ALGO)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_file_hash(file_path: str, mtime_ns: int, size: int) -> str:
+    """
+    Hash a file once per (path, modification time, size).
+    
+    Retry rounds dump the same files again; a changed file misses the cache
+    because its mtime or size differs.
+    
+    Args:
+        file_path: Path to the file
+        mtime_ns: Modification time of the file in nanoseconds, part of the cache key
+        size: Size of the file in bytes, part of the cache key
+        
+    Returns:
+        Hex digest of the file contents
+    """
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, _file_hasher).hexdigest()
+        # Python < 3.11: hash 64 KiB blocks
+        file_hash = _file_hasher()
+        while chunk := f.read(1 << 16):
+            file_hash.update(chunk)
+        return file_hash.hexdigest()
+
 class CSVResultDumper:
     """Handles dumping processing results to CSV files."""
     
@@ -21,7 +177,16 @@ class CSVResultDumper:
             output_dir = DEFAULT_OUTPUT_DIR
         
         self.output_dir = output_dir
-        self.global_df = pd.DataFrame()
+        self._rows: List[Optional[ResultRow]] = []  # Result rows in CSV order, None for replaced rows
+        self._row_index: Dict[str, List[int]] = {}  # Positions in self._rows of each file's rows
+        self._removed_count = 0  # Replaced rows (None) still in self._rows
+        self._fieldnames: Tuple[str, ...] = None  # CSV header, set by the structure of the first row
+        self._row_values = None  # Gets a row's values in self._fieldnames order
+        self._rows_written = 0  # Leading rows of self._rows already on disk
+        self._stale_rows_on_disk = 0  # Rows in the CSV file replaced by retries, dropped on compaction
+        self._csv_handle = None  # CSV file kept open for appends between groups
+        self._csv_writer = None
+        self._global_df: Optional[pd.DataFrame] = None  # Cached DataFrame of the rows, reset when they change
         self.output_file = None
         self.file_retry_rounds = {}  # Track retry rounds for each file
         
@@ -38,13 +203,24 @@ class CSVResultDumper:
         
         logging.info(f"📊 Initialized CSV dumper with output file: {self.output_file}")
     
-    def get_file_hash(self, file_path: str) -> str:
-        """Generate MD5 hash for file."""
+    @property
+    def global_df(self) -> pd.DataFrame:
+        """All result rows as a DataFrame, built from the row buffer once per change."""
+        if self._global_df is None:
+            rows = self._current_rows()
+            if self._row_values is not None:
+                rows = [self._row_values(row) for row in rows]
+            self._global_df = pd.DataFrame.from_records(rows, columns=self._fieldnames)
+        return self._global_df
+    
+    def get_file_hash(self, file_path: str, file_stat: os.stat_result = None) -> str:
+        """Generate the fingerprint hash (FILE_HASH_ALGO) for file, reusing the hash of an unchanged file."""
         try:
-            with open(file_path, 'rb') as f:
-                return hashlib.md5(f.read()).hexdigest()
+            if file_stat is None:
+                file_stat = os.stat(file_path)
+            return _cached_file_hash(file_path, file_stat.st_mtime_ns, file_stat.st_size)
         except Exception as e:
-            logging.warning(f"Failed to calculate hash for {file_path}: {e}")
+            logging.warning("Failed to calculate hash for %s: %s", file_path, e)
             return ""
     
     def _check_mandatory_keys(self, result: Dict[str, Any]) -> Tuple[bool, List[str]]:
@@ -56,34 +232,27 @@ class CSVResultDumper:
         if result.get('DOC_TYPE') == 'Outros':
             return True, []  # Skip validation for 'Outros' documents
         
-        # Filter out empty strings and whitespace-only strings from mandatory keys
-        filtered_mandatory_keys = [key for key in MANDATORY_KEYS if key and key.strip()]
-        
         # If no valid mandatory keys, return success
-        if not filtered_mandatory_keys:
-            logging.info("✅ No valid mandatory keys to validate - skipping validation")
+        if not _MANDATORY_KEYS:
+            logging.debug("✅ No valid mandatory keys to validate - skipping validation")
             return True, []
         
-        missing_keys = []
-        present_keys = []
-        for key in filtered_mandatory_keys:
-            value = result.get(key)
-            if value is None or value == "" or value == "Not found":
-                missing_keys.append(key)
-            else:
-                present_keys.append(key)
+        missing_keys = [key for key in _MANDATORY_KEYS
+                        if (value := result.get(key)) is None or value == "" or value == "Not found"]
         
-        # Log the status of mandatory keys
-        if len(missing_keys) == 0:
-            logging.info(f"✅ All mandatory keys present: {present_keys}")
-        else:
-            logging.warning(f"⚠️ Missing mandatory keys: {missing_keys}. Present keys: {present_keys}")
+        # Log the status of mandatory keys; per-file, so only at DEBUG
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            if len(missing_keys) == 0:
+                logging.debug("✅ All mandatory keys present: %s", list(_MANDATORY_KEYS))
+            else:
+                present_keys = [key for key in _MANDATORY_KEYS if key not in missing_keys]
+                logging.debug("⚠️ Missing mandatory keys: %s. Present keys: %s", missing_keys, present_keys)
         
         return len(missing_keys) == 0, missing_keys
     
     def dump_group_results(self, group_results: List[tuple], group_id: str) -> None:
         """
-        Dump group results to CSV and update global DataFrame.
+        Dump group results to CSV and update the row buffer.
         
         Args:
             group_results: List of tuples (file_path, result_dict)
@@ -91,23 +260,28 @@ class CSVResultDumper:
         """
         logging.info(f"📊 Dumping results for group {group_id} to CSV...")
         
+        # Rows built from direct results share one timestamp per group
+        group_timestamp = datetime.now().isoformat()
+        
         # Process each file result in the group
         for file_path, result in group_results:
-            self._process_single_result(file_path, result, group_id)
+            self._process_single_result(file_path, result, group_id, group_timestamp)
         
-        # Save the updated global DataFrame to CSV
+        # Append the new rows to the CSV
         self._save_to_csv()
         
-        logging.info(f"✅ Group {group_id} results dumped to CSV. Total records: {len(self.global_df)}")
+        logging.info(f"✅ Group {group_id} results dumped to CSV. Total records: {len(self._rows) - self._removed_count}")
     
-    def _process_single_result(self, file_path: str, result: Dict[str, Any], group_id: str) -> None:
+    def _process_single_result(self, file_path: str, result: Dict[str, Any], group_id: str,
+                               group_timestamp: Optional[str] = None) -> None:
         """
-        Process a single file result and add it to the global DataFrame.
+        Process a single file result and add it to the row buffer.
         
         Args:
             file_path: Path to the processed file
             result: Result dictionary containing extracted data
             group_id: Identifier for the group
+            group_timestamp: ISO timestamp of the group dump, taken now if not given
         """
         # Check if result is None
         if result is None:
@@ -117,264 +291,241 @@ class CSVResultDumper:
         # Handle different result structures
         # New structure: result contains 'file_model_output', 'file_token_stats', 'file_info'
         # Legacy structure: result contains 'model_output', 'file_info', etc.
+        # Direct structure: result contains extracted data directly
+        shape = _result_shape(result)
+        if shape == 'direct':
+            row = self._direct_row(file_path, result, group_id, group_timestamp or datetime.now().isoformat())
+        else:
+            row = self._structured_row(file_path, result, group_id, shape)
+        retry_round = row.retry_round
         
-        # Extract basic information
-        if 'file_model_output' in result:
-            # New structure
+        # Handle retries by removing previous entries for the same file
+        if retry_round is not None and retry_round > 0:
+            # Remove previous entries for this file from the row buffer
+            self._remove_rows(file_path)
+            logging.debug("🔄 Removed previous entry for retry file: %s (retry round %s)", file_path, retry_round)
+        elif '_retry_' in group_id:
+            # For retry groups, always remove previous entries to ensure we get the latest result
+            self._remove_rows(file_path)
+            logging.debug("🔄 Removed previous entry for retry file: %s (retry group)", file_path)
+        
+        if self._fieldnames is None:
+            self._fieldnames = _DIRECT_COLUMNS if shape == 'direct' else COLUMNS
+            self._row_values = operator.attrgetter(*self._fieldnames)
+        self._row_index.setdefault(file_path, []).append(len(self._rows))
+        self._rows.append(row)
+        self._global_df = None
+    
+    def _structured_row(self, file_path: str, result: Dict[str, Any], group_id: str, shape: str) -> ResultRow:
+        """
+        Build the CSV row for a result in the new or legacy structure.
+        
+        Args:
+            file_path: Path to the processed file
+            result: Result dictionary in the new or legacy structure
+            group_id: Identifier for the group
+            shape: 'new' or 'legacy', as returned by _result_shape
+            
+        Returns:
+            Row data for the CSV
+        """
+        file_info = result.get('file_info', {})
+        if shape == 'new':
             file_process_result = result.get('file_process_result', {})
-            success = file_process_result.get('success', False)
             model_output = result.get('file_model_output', {})
-            file_info = result.get('file_info', {})
             timestamp = file_process_result.get('proc_timestamp', '')
-            retry_round = file_process_result.get('retry_round', None)
-            
-            # Create a row for the DataFrame
-            row_data = {
-                'file_path': file_path,
-                'file_name': file_info.get('file_name', ''),
-                'group_id': group_id,
-                'success': success,
-                'timestamp': timestamp,
-                'retry_round': retry_round,
-                'file_size_mb': file_info.get('file_size_mb', 0),
-                'estimated_tokens': file_info.get('estimated_tokens', 0),
-                'file_hash': file_info.get('file_hash', ''),
-                'modification_time': file_info.get('modification_time', ''),
-                # Token counts are only available at group/overall level, not file level
-                'prompt_token_count': 0,
-                'candidates_token_count': 0,
-                'total_token_count': 0,
-                'other_token_count': 0,
-            }
-            
-            # Add model output fields
-            if model_output and isinstance(model_output, dict):
-                row_data.update({
-                    'file_name_llm': model_output.get('file_name_llm', ''),
-                    'DOC_TYPE': model_output.get('DOC_TYPE', ''),
-                    'CNPJ_1': model_output.get('CNPJ_1', ''),
-                    'CNPJ_2': model_output.get('CNPJ_2', ''),
-                    'VALOR_TOTAL': model_output.get('VALOR_TOTAL', ''),
-                    'Chassi': model_output.get('Chassi', ''),
-                    'CLAIM_NUMBER': model_output.get('CLAIM_NUMBER', ''),
-                    # Extract token fields from file_model_output
-                    'prompt_token_count': model_output.get('prompt_token_count', 0),
-                    'candidates_token_count': model_output.get('candidates_token_count', 0),
-                    'total_token_count': model_output.get('total_token_count', 0),
-                    'other_token_count': model_output.get('total_token_count', 0) - model_output.get('prompt_token_count', 0) - model_output.get('candidates_token_count', 0),
-                })
-            else:
-                # Add empty values for model output fields if no model_output or if it's not a dict
-                row_data.update({
-                    'file_name_llm': '',
-                    'DOC_TYPE': '',
-                    'CNPJ_1': '',
-                    'CNPJ_2': '',
-                    'VALOR_TOTAL': '',
-                    'Chassi': '',
-                    'CLAIM_NUMBER': '',
-                })
-            
-            # Add file group IDs if available
-            if 'group_ids_incl_retries' in file_process_result:
-                row_data['file_group_ids_incl_retries'] = ','.join(file_process_result['group_ids_incl_retries'])
-            else:
-                row_data['file_group_ids_incl_retries'] = group_id
-                
-        elif 'model_output' in result:
-            # Legacy structure
-            success = result.get('success', False)
+            group_ids = file_process_result.get('group_ids_incl_retries')
+        else:
+            # Legacy structure keeps the process status on the result itself
+            file_process_result = result
             model_output = result.get('model_output', {})
-            token_stats = {}  # No token stats in legacy structure
-            file_info = result.get('file_info', {})
             timestamp = result.get('timestamp', '')
-            retry_round = result.get('retry_round', None)
-            
-            # Create a row for the DataFrame
-            row_data = {
-                'file_path': file_path,
-                'file_name': file_info.get('file_name', ''),
-                'group_id': group_id,
-                'success': success,
-                'timestamp': timestamp,
-                'retry_round': retry_round,
-                'file_size_mb': file_info.get('file_size_mb', 0),
-                'estimated_tokens': file_info.get('estimated_tokens', 0),
-                'file_hash': file_info.get('file_hash', ''),
-                'modification_time': file_info.get('modification_time', ''),
-                'prompt_token_count': token_stats.get('prompt_tokens', 0),
-                'candidates_token_count': token_stats.get('candidates_tokens', 0),
-                'total_token_count': token_stats.get('actual_tokens', 0),
-                'other_token_count': token_stats.get('other_tokens', 0),
-            }
-            
-            # Add model output fields
-            if model_output and isinstance(model_output, dict):
-                row_data.update({
-                    'file_name_llm': model_output.get('file_name_llm', ''),
-                    'DOC_TYPE': model_output.get('DOC_TYPE', ''),
-                    'CNPJ_1': model_output.get('CNPJ_1', ''),
-                    'CNPJ_2': model_output.get('CNPJ_2', ''),
-                    'VALOR_TOTAL': model_output.get('VALOR_TOTAL', ''),
-                    'Chassi': model_output.get('Chassi', ''),
-                    'CLAIM_NUMBER': model_output.get('CLAIM_NUMBER', ''),
-                })
-            else:
-                # Add empty values for model output fields if no model_output or if it's not a dict
-                row_data.update({
-                    'file_name_llm': '',
-                    'DOC_TYPE': '',
-                    'CNPJ_1': '',
-                    'CNPJ_2': '',
-                    'VALOR_TOTAL': '',
-                    'Chassi': '',
-                    'CLAIM_NUMBER': '',
-                })
-            
-            # Add file group IDs if available
-            if 'file_group_ids_incl_retries' in file_info:
-                row_data['file_group_ids_incl_retries'] = ','.join(file_info['file_group_ids_incl_retries'])
-            else:
-                row_data['file_group_ids_incl_retries'] = group_id
-                
+            group_ids = file_info.get('file_group_ids_incl_retries')
+        
+        # Model output fields; token counts are only available at group/overall
+        # level, except in the new structure's file_model_output
+        if model_output and isinstance(model_output, dict):
+            extracted_fields = _extracted_fields(model_output)
+            token_fields = _token_fields(model_output) if shape == 'new' else _ZERO_TOKEN_FIELDS
         else:
-            # Current project structure - result contains extracted data directly
-            # Check if result has error AND validate mandatory keys
-            has_error = 'error' in result
-            
-            # Use the helper method to check mandatory keys
-            has_all_keys, missing_keys = self._check_mandatory_keys(result)
-            
-            # Success means no error AND all mandatory keys are present
-            success = not has_error and has_all_keys
-            retry_round = None  # Extract retry info from group_id if available
-            
-            # Extract retry round from group_id if it contains retry information
-            if '_retry_' in group_id:
-                try:
-                    retry_round = int(group_id.split('_retry_')[1].split('_')[0])
-                    # Store the retry round for this file
-                    self.file_retry_rounds[file_path] = retry_round
-                except (IndexError, ValueError):
-                    retry_round = None
-            else:
-                # Check if we have a stored retry round for this file
-                retry_round = self.file_retry_rounds.get(file_path, None)
-            
-            # Get file information
-            try:
-                file_stat = os.stat(file_path)
-                file_size_mb = round(file_stat.st_size / (1024 * 1024), 2)
-                modification_time = datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                file_hash = self.get_file_hash(file_path)
-            except (OSError, FileNotFoundError):
-                file_size_mb = 0
-                modification_time = ''
-                file_hash = ''
-            
-            # Calculate estimated tokens based on file size and result
-            estimated_tokens = 0
-            if 'estimated_tokens' in result:
-                estimated_tokens = result['estimated_tokens']
-            else:
-                # Simple estimation based on file size
-                try:
-                    file_size_mb_actual = os.path.getsize(file_path) / (1024 * 1024)
-                    if file_size_mb_actual < 0.05:
-                        estimated_tokens = 4500
-                    elif file_size_mb_actual < 0.15:
-                        estimated_tokens = 5000
-                    else:
-                        estimated_tokens = 5500
-                except (OSError, FileNotFoundError):
-                    estimated_tokens = 5000  # Default estimate
-            
-            # Create row data for current project structure
-            row_data = {
-                'file_path': file_path,
-                'file_name': os.path.basename(file_path),
-                'group_id': group_id,
-                'success': success,
-                'timestamp': datetime.now().isoformat(),
-                'retry_round': retry_round,
-                'file_size_mb': file_size_mb,
-                'estimated_tokens': estimated_tokens,
-                'file_hash': file_hash,
-                'modification_time': modification_time,
-                'file_group_ids_incl_retries': group_id,
-                'prompt_token_count': 0,  # Will be updated below if available
-                'candidates_token_count': 0,  # Will be updated below if available
-                'total_token_count': 0,  # Will be updated below if available
-                'other_token_count': 0,  # Will be updated below if available
-            }
+            # Empty values for model output fields if no model_output or if it's not a dict
+            extracted_fields = _EMPTY_EXTRACTED_FIELDS
+            token_fields = _ZERO_TOKEN_FIELDS
+        
+        return ResultRow(
+            file_path=file_path,
+            file_name=file_info.get('file_name', ''),
+            group_id=group_id,
+            success=file_process_result.get('success', False),
+            timestamp=timestamp,
+            retry_round=file_process_result.get('retry_round', None),
+            file_size_mb=file_info.get('file_size_mb', 0.0),
+            estimated_tokens=file_info.get('estimated_tokens', 0),
+            file_hash=file_info.get('file_hash', ''),
+            modification_time=file_info.get('modification_time', ''),
+            **token_fields,
+            **extracted_fields,
+            # File group IDs if available
+            file_group_ids_incl_retries=','.join(group_ids) if group_ids is not None else group_id,
+        )
+    
+    def _direct_row(self, file_path: str, result: Dict[str, Any], group_id: str, timestamp: str) -> ResultRow:
+        """
+        Build the CSV row for a result that contains the extracted data directly.
+        
+        Args:
+            file_path: Path to the processed file
+            result: Extracted data, or a dictionary with an 'error' key
+            group_id: Identifier for the group
+            timestamp: ISO timestamp recorded for the row
             
-            # Add extracted data fields directly from result
-            if 'error' not in result:
-                # Handle both new structure (file_model_output) and old structure
-                if 'file_model_output' in result:
-                    model_output = result['file_model_output']
-                    row_data.update({
-                        'file_name_llm': model_output.get('file_name_llm', ''),
-                        'DOC_TYPE': model_output.get('DOC_TYPE', ''),
-                        'CNPJ_1': model_output.get('CNPJ_1', ''),
-                        'CNPJ_2': model_output.get('CNPJ_2', ''),
-                        'VALOR_TOTAL': model_output.get('VALOR_TOTAL', ''),
-                        'Chassi': model_output.get('Chassi', ''),
-                        'CLAIM_NUMBER': model_output.get('CLAIM_NUMBER', ''),
-                        # Extract token fields from file_model_output
-                        'prompt_token_count': model_output.get('prompt_token_count', 0),
-                        'candidates_token_count': model_output.get('candidates_token_count', 0),
-                        'total_token_count': model_output.get('total_token_count', 0),
-                        'other_token_count': model_output.get('total_token_count', 0) - model_output.get('prompt_token_count', 0) - model_output.get('candidates_token_count', 0),
-                    })
-                else:
-                    # Old structure - extract directly from result
-                    row_data.update({
-                        'file_name_llm': result.get('file_name_llm', ''),
-                        'DOC_TYPE': result.get('DOC_TYPE', ''),
-                        'CNPJ_1': result.get('CNPJ_1', ''),
-                        'CNPJ_2': result.get('CNPJ_2', ''),
-                        'VALOR_TOTAL': result.get('VALOR_TOTAL', ''),
-                        'Chassi': result.get('Chassi', ''),
-                        'CLAIM_NUMBER': result.get('CLAIM_NUMBER', ''),
-                    })
-            else:
-                # Add empty values for failed results
-                row_data.update({
-                    'file_name_llm': '',
-                    'DOC_TYPE': '',
-                    'CNPJ_1': '',
-                    'CNPJ_2': '',
-                    'VALOR_TOTAL': '',
-                    'Chassi': '',
-                    'CLAIM_NUMBER': '',
-                })
+        Returns:
+            Row data for the CSV
+        """
+        # Check if result has error AND validate mandatory keys
+        has_error = 'error' in result
         
-        # Handle retries by removing previous entries for the same file
-        if retry_round is not None and retry_round > 0:
-            # Remove previous entries for this file from global DataFrame
-            self.global_df = self.global_df[self.global_df['file_path'] != file_path]
-            logging.info(f"🔄 Removed previous entry for retry file: {file_path} (retry round {retry_round})")
-        elif '_retry_' in group_id:
-            # For retry groups, always remove previous entries to ensure we get the latest result
-            self.global_df = self.global_df[self.global_df['file_path'] != file_path]
-            logging.info(f"🔄 Removed previous entry for retry file: {file_path} (retry group)")
+        # Use the helper method to check mandatory keys
+        has_all_keys, missing_keys = self._check_mandatory_keys(result)
+        
+        # Success means no error AND all mandatory keys are present
+        success = not has_error and has_all_keys
+        retry_round = None  # Extract retry info from group_id if available
         
-        # Convert to DataFrame and append to global DataFrame
-        row_df = pd.DataFrame([row_data])
-        self.global_df = pd.concat([self.global_df, row_df], ignore_index=True)
+        # Extract retry round from group_id if it contains retry information
+        if '_retry_' in group_id:
+            match = _RETRY_RE.search(group_id)
+            if match:
+                retry_round = int(match.group(1))
+                # Store the retry round for this file
+                self.file_retry_rounds[file_path] = retry_round
+        else:
+            # Check if we have a stored retry round for this file
+            retry_round = self.file_retry_rounds.get(file_path, None)
+        
+        # Get file information; one stat serves size, mtime, hash and token estimate
+        try:
+            file_stat = os.stat(file_path)
+            file_size_mb_actual = file_stat.st_size / (1024 * 1024)
+            file_size_mb = round(file_size_mb_actual, 2)
+            modification_time = datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+            file_hash = self.get_file_hash(file_path, file_stat)
+        except (OSError, FileNotFoundError):
+            file_size_mb_actual = None
+            file_size_mb = 0.0
+            modification_time = ''
+            file_hash = ''
+        
+        # Calculate estimated tokens based on file size and result
+        estimated_tokens = 0
+        if 'estimated_tokens' in result:
+            estimated_tokens = result['estimated_tokens']
+        elif file_size_mb_actual is None:
+            estimated_tokens = 5000  # Default estimate
+        # Simple estimation based on file size
+        elif file_size_mb_actual < 0.05:
+            estimated_tokens = 4500
+        elif file_size_mb_actual < 0.15:
+            estimated_tokens = 5000
+        else:
+            estimated_tokens = 5500
+        
+        # Create row data for current project structure, with extracted data fields
+        # directly from result, or empty values for failed results
+        return ResultRow(
+            file_path=file_path,
+            file_name=os.path.basename(file_path),
+            group_id=group_id,
+            success=success,
+            timestamp=timestamp,
+            retry_round=retry_round,
+            file_size_mb=file_size_mb,
+            estimated_tokens=estimated_tokens,
+            file_hash=file_hash,
+            modification_time=modification_time,
+            file_group_ids_incl_retries=group_id,
+            **_ZERO_TOKEN_FIELDS,
+            **(_extracted_fields(result) if not has_error else _EMPTY_EXTRACTED_FIELDS),
+        )
+    
+    def _remove_rows(self, file_path: str) -> None:
+        """Drop buffered rows of a file; the CSV is rewritten if any of them was already saved."""
+        positions = self._row_index.pop(file_path, None)
+        if not positions:
+            return
+        
+        # Blank the rows in place so the other rows keep their positions
+        for position in positions:
+            self._rows[position] = None
+        self._global_df = None
+        self._removed_count += len(positions)
+        self._stale_rows_on_disk += sum(1 for position in positions if position < self._rows_written)
+    
+    def _current_rows(self) -> List[ResultRow]:
+        """Buffered rows without the ones replaced by retries."""
+        if not self._removed_count:
+            return self._rows
+        return [row for row in self._rows if row is not None]
+    
+    def _compact_rows(self) -> None:
+        """Drop replaced rows from the buffer and rebuild the row index."""
+        self._rows = self._current_rows()
+        self._removed_count = 0
+        self._row_index = {}
+        for position, row in enumerate(self._rows):
+            self._row_index.setdefault(row.file_path, []).append(position)
     
     def _save_to_csv(self) -> None:
-        """Save the global DataFrame to CSV file."""
+        """
+        Append rows added since the last save to the CSV file.
+        
+        Rows replaced by retries stay in the file until it is compacted, which
+        happens once they exceed a quarter of the current rows and on close().
+        """
+        try:
+            current_count = len(self._rows) - self._removed_count
+            if self._csv_writer is None or self._stale_rows_on_disk * 4 > current_count:
+                self._rewrite_csv()
+            else:
+                self._csv_writer.writerows(self._row_values(row) for row in self._rows[self._rows_written:] if row is not None)
+                self._rows_written = len(self._rows)
+            self._csv_handle.flush()
+            logging.debug("💾 CSV file updated: %s", self.output_file)
+        except Exception as e:
+            logging.error(f"❌ Error saving CSV file: {e}")
+    
+    def _rewrite_csv(self) -> None:
+        """Rewrite the CSV file from the compacted row buffer and keep it open for appends."""
+        self._compact_rows()
+        if self._csv_handle is not None:
+            self._csv_handle.close()
+        self._csv_handle = open(self.output_file, 'w', newline='', encoding='utf-8')
+        self._csv_writer = None
+        if self._fieldnames is not None:
+            self._csv_writer = csv.writer(self._csv_handle, lineterminator='\n')
+            self._csv_writer.writerow(self._fieldnames)
+            self._csv_writer.writerows(map(self._row_values, self._rows))
+        self._rows_written = len(self._rows)
+        self._stale_rows_on_disk = 0
+    
+    def close(self) -> None:
+        """Compact away rows replaced by retries and close the CSV file."""
+        if self._csv_handle is None:
+            return
         try:
-            self.global_df.to_csv(self.output_file, index=False, encoding='utf-8')
-            logging.info(f"💾 CSV file updated: {self.output_file}")
+            if self._stale_rows_on_disk:
+                self._rewrite_csv()
+                logging.info(f"💾 CSV file compacted: {self.output_file}")
         except Exception as e:
             logging.error(f"❌ Error saving CSV file: {e}")
+        finally:
+            self._csv_handle.close()
+            self._csv_handle = None
+            self._csv_writer = None
     
     def get_summary_stats(self) -> Dict[str, Any]:
-        """Get summary statistics from the global DataFrame."""
-        if self.global_df.empty:
+        """Get summary statistics from the buffered result rows."""
+        if len(self._rows) == self._removed_count:
             return {
                 'total_files': 0,
                 'successful_files': 0,
@@ -385,15 +536,17 @@ class CSVResultDumper:
                 'retry_files': 0
             }
         
-        total_files = len(self.global_df)
-        successful_files = len(self.global_df[self.global_df['success'] == True])
-        failed_files = len(self.global_df[self.global_df['success'] == False])
+        global_df = self.global_df
+        total_files = len(global_df)
+        successful_files = int((global_df['success'] == True).sum())
+        failed_files = int((global_df['success'] == False).sum())
         success_rate = (successful_files / total_files * 100) if total_files > 0 else 0
-        unique_groups = self.global_df['group_id'].nunique()
-        files_with_retries = len(self.global_df[self.global_df['retry_round'].notna()])
+        unique_groups = global_df['group_id'].nunique()
+        has_retry_round = global_df['retry_round'].notna()
+        files_with_retries = int(has_retry_round.sum())
         
         # Count retry files (files with retry_round > 0)
-        retry_files = len(self.global_df[(self.global_df['retry_round'].notna()) & (self.global_df['retry_round'] > 0)])
+        retry_files = int((has_retry_round & (global_df['retry_round'] > 0)).sum())
         
         return {
             'total_files': total_files,
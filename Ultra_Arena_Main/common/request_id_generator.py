@@ -6,66 +6,105 @@ This module provides thread-safe UUID generation and request mechanism detection
 for tracking processing requests across different entry points.
 """
 
-import uuid
+import os
 import threading
 import time
 import inspect
+import functools
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Per-thread cache of the detected request mechanism; a thread is started by
+# one entry point (REST worker, CLI main thread, ...) for its whole life
+_thread_state = threading.local()
+
+# Call-stack markers per mechanism, in priority order; matched against each
+# frame's lowercased filename and function name
+_MECHANISM_MARKERS = (
+    ('rest', ('flask', 'request_processor')),
+    ('cli', ('argparse', 'main.py')),
+    ('direct', ('direct_test', 'direct_call')),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _utc_iso_second(epoch_seconds: int) -> str:
+    """Format a UTC second as naive ISO 8601, cached since consecutive requests share it."""
+    return datetime.fromtimestamp(epoch_seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
 
 class RequestIDGenerator:
     """Thread-safe request ID generator with mechanism detection."""
     
-    _lock = threading.Lock()
-    
     @staticmethod
     def generate_request_id() -> str:
         """
         Generate a thread-safe unique request ID.
         
+        The random bytes come straight from os.urandom, which is already safe
+        to call from any thread, and are formatted as a version 4 UUID string
+        without constructing a uuid.UUID object.
+        
         Returns:
             str: Unique UUID string
         """
-        with RequestIDGenerator._lock:
-            request_id = str(uuid.uuid4())
-            logger.debug(f"🔑 Generated request ID: {request_id}")
-            return request_id
+        raw = bytearray(os.urandom(16))
+        raw[6] = (raw[6] & 0x0F) | 0x40  # Version 4
+        raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+        hex_id = raw.hex()
+        request_id = f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
+        logger.debug("🔑 Generated request ID: %s", request_id)
+        return request_id
     
     @staticmethod
     def detect_request_mechanism() -> str:
         """
         Detect the request mechanism by analyzing the call stack.
         
+        The stack is only walked on the first call in each thread; later
+        calls return the mechanism cached for that thread.
+        
+        Returns:
+            str: Request mechanism ('rest', 'cli', 'direct', or 'other')
+        """
+        mechanism = getattr(_thread_state, 'request_mechanism', None)
+        if mechanism is None:
+            mechanism = RequestIDGenerator._detect_from_stack()
+            _thread_state.request_mechanism = mechanism
+        return mechanism
+    
+    @staticmethod
+    def _detect_from_stack() -> str:
+        """
+        Detect the request mechanism by walking the current call stack.
+        
         Returns:
             str: Request mechanism ('rest', 'cli', 'direct', or 'other')
         """
         try:
-            # Get the call stack
+            # Scan each frame's code location directly; a match for a higher
+            # priority mechanism wins no matter where it is on the stack
+            best = len(_MECHANISM_MARKERS)
             frame = inspect.currentframe()
-            stack = []
-            while frame:
-                stack.append(frame)
+            while frame and best:
+                code = frame.f_code
+                location = f"{code.co_filename} {code.co_name}".lower()
+                for priority in range(best):
+                    if any(marker in location for marker in _MECHANISM_MARKERS[priority][1]):
+                        best = priority
+                        break
                 frame = frame.f_back
+            # Frames reference their locals, so drop ours to avoid a reference cycle
+            del frame
             
-            # Look for characteristic patterns in the call stack
-            stack_str = str(stack)
-            
-            if 'flask' in stack_str.lower() or 'request_processor' in stack_str.lower():
-                return 'rest'
-            elif 'argparse' in stack_str.lower() or 'main.py' in stack_str.lower():
-                return 'cli'
-            elif 'direct_test' in stack_str.lower() or 'direct_call' in stack_str.lower():
-                return 'direct'
-            else:
-                return 'other'
+            return _MECHANISM_MARKERS[best][0] if best < len(_MECHANISM_MARKERS) else 'other'
                 
         except Exception as e:
-            logger.warning(f"⚠️ Could not detect request mechanism: {e}")
+            logger.warning("⚠️ Could not detect request mechanism: %s", e)
             return 'other'
     
     @staticmethod
@@ -73,10 +112,17 @@ class RequestIDGenerator:
         """
         Get the current request start time in ISO format.
         
+        Same format as datetime.utcnow().isoformat() (UTC without offset,
+        microseconds omitted when zero), built from time.time_ns() and a
+        cached per-second prefix instead of a datetime object per call.
+        
         Returns:
             str: ISO formatted timestamp
         """
-        return datetime.utcnow().isoformat()
+        epoch_seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+        microseconds = nanoseconds // 1000
+        iso_second = _utc_iso_second(epoch_seconds)
+        return f"{iso_second}.{microseconds:06d}" if microseconds else iso_second
     
     @staticmethod
     def get_utc_timezone() -> str:
@@ -2,28 +2,231 @@
 Text extraction module supporting multiple PDF extraction libraries.
 """
 
+import atexit
 import os
 import logging
+import functools
+import importlib
+import queue
+import threading
 import regex as re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-# Import PDF extraction libraries
+
+def _can_import(*module_names: str) -> bool:
+    """Import modules and report whether all of them imported cleanly.
+    
+    A module that is present but fails to import, such as a broken install
+    or an unrelated package under the same name, counts as unavailable.
+    
+    Args:
+        module_names: Top-level module names
+    
+    Returns:
+        True if all modules imported, False otherwise
+    """
+    for name in module_names:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            logging.debug("Import of %s failed: %s", name, e)
+            return False
+    return True
+
+
+# PDF extraction libraries are imported by _check_libraries when the first
+# TextExtractor is created, so importing this module does not load MuPDF or
+# the OCR stack; the flags are None until then
+PYMUPDF_AVAILABLE = None
+PYTESSERACT_AVAILABLE = None
+# Optional: in-process Tesseract API, used instead of pytesseract when installed
+TESSEROCR_AVAILABLE = None
+# Optional: page image cleanup before OCR
+CV2_AVAILABLE = None
+
+_library_check_lock = threading.Lock()
+
+
+def _check_libraries():
+    """Import the extraction libraries once and set the availability flags."""
+    global PYMUPDF_AVAILABLE, PYTESSERACT_AVAILABLE, TESSEROCR_AVAILABLE, CV2_AVAILABLE
+    if PYMUPDF_AVAILABLE is not None:
+        return
+    
+    with _library_check_lock:
+        if PYMUPDF_AVAILABLE is not None:
+            return
+        
+        PYTESSERACT_AVAILABLE = _can_import("pytesseract", "PIL", "pdf2image")
+        if not PYTESSERACT_AVAILABLE:
+            logging.warning("Pytesseract not available. Install with: pip install pytesseract pdf2image Pillow")
+        TESSEROCR_AVAILABLE = _can_import("tesserocr")
+        CV2_AVAILABLE = _can_import("cv2", "numpy")
+        
+        # Set last: it marks the check as done for callers outside the lock
+        pymupdf_available = _can_import("fitz")
+        if not pymupdf_available:
+            logging.warning("PyMuPDF not available. Install with: pip install PyMuPDF")
+        PYMUPDF_AVAILABLE = pymupdf_available
+
 try:
-    import fitz  # PyMuPDF
-    PYMUPDF_AVAILABLE = True
+    import ahocorasick  # Optional: single-pass document type indicator scan
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    PYMUPDF_AVAILABLE = False
-    logging.warning("PyMuPDF not available. Install with: pip install PyMuPDF")
+    AHOCORASICK_AVAILABLE = False
 
 try:
-    import pytesseract
-    from PIL import Image
-    import pdf2image
-    PYTESSERACT_AVAILABLE = True
+    from config.config_base import OCR_PREPROCESS_IMAGES
 except ImportError:
-    PYTESSERACT_AVAILABLE = False
-    logging.warning("Pytesseract not available. Install with: pip install pytesseract pdf2image Pillow")
+    OCR_PREPROCESS_IMAGES = False
+
+try:
+    from config.config_base import OCR_PAGE_WORKERS
+except ImportError:
+    OCR_PAGE_WORKERS = 2
+
+# Patterns used on every page or document, compiled once
+_WHITESPACE_RE = re.compile(r'\s+')
+_CNPJ_RE = re.compile(r'\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}')  # CNPJ format XX.XXX.XXX/XXXX-XX
+_CLAIM_NUMBER_RE = re.compile(r'')
+_CHASSI_RE = re.compile(r'')
+
+# Document type indicators, checked in priority order: any service indicator wins over parts
+_SERVICE_INDICATORS = ("NFS-E", "NFSE", "NOTA FISCAL ELETRÔNICA DE SERVIÇOS", "TOMADOR DE SERVIÇOS")
+_PARTS_INDICATORS = ("NF-E",)
+
+if AHOCORASICK_AVAILABLE:
+    # Keys are case-folded; pyahocorasick has no case-insensitive mode, so the
+    # text is folded once per call on this path (the regex fallback needs no copy)
+    _DOC_TYPE_AUTOMATON = ahocorasick.Automaton()
+    for _indicator in _SERVICE_INDICATORS:
+        _DOC_TYPE_AUTOMATON.add_word(_indicator.casefold(), "Serviço")
+    for _indicator in _PARTS_INDICATORS:
+        _DOC_TYPE_AUTOMATON.add_word(_indicator.casefold(), "Peças")
+    _DOC_TYPE_AUTOMATON.make_automaton()
+
+# Case-insensitive alternations over the same indicators, so the text is not uppercased
+_SERVICE_RE = re.compile('|'.join(map(re.escape, _SERVICE_INDICATORS)), re.IGNORECASE)
+_PARTS_RE = re.compile('|'.join(map(re.escape, _PARTS_INDICATORS)), re.IGNORECASE)
+
+# ASCII control characters dropped by _clean_text, except newline and carriage return
+_CONTROL_CHARS_TABLE = dict.fromkeys(
+    [code for code in range(32) if code not in (10, 13)] + [127]
+)
+
+
+# Idle tesserocr API handles, reused across pages and documents so the language
+# model is loaded once per handle instead of once per page
+_tesserocr_apis = queue.SimpleQueue()
+# Error from the first failed handle creation; once set, OCR goes through pytesseract
+_tesserocr_init_error = None
+
+
+@functools.lru_cache(maxsize=None)
+def _import_cv2():
+    """Import OpenCV on first use and limit it to one thread.
+    
+    Returns:
+        The cv2 module
+    """
+    import cv2
+    # Pages are already OCRed in parallel, so keep OpenCV from spawning its own threads per call
+    cv2.setNumThreads(1)
+    return cv2
+
+
+def _preprocess_image(image):
+    """Denoise, grayscale and binarize a page image so Tesseract reads it faster and better.
+    
+    Args:
+        image: PIL image of the page
+    
+    Returns:
+        Binarized PIL image of the page
+    """
+    import numpy as np
+    from PIL import Image
+    cv2 = _import_cv2()
+    
+    pixels = np.asarray(image.convert('RGB'))
+    pixels = cv2.fastNlMeansDenoisingColored(pixels, None, 5, 5, 7, 21)
+    gray = cv2.cvtColor(pixels, cv2.COLOR_RGB2GRAY)
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    return Image.fromarray(binary)
+
+
+def _ocr_preprocessed_page(ocr_page, image) -> str:
+    """OCR one page image after _preprocess_image.
+    
+    Args:
+        ocr_page: OCR function taking a PIL image and returning its text
+        image: PIL image of the page
+    
+    Returns:
+        Recognized page text
+    """
+    return ocr_page(_preprocess_image(image))
+
+
+def _ocr_page_pytesseract(image) -> str:
+    """OCR one page image with a tesseract process through pytesseract.
+    
+    Args:
+        image: PIL image of the page
+    
+    Returns:
+        Recognized page text
+    """
+    import pytesseract
+    return pytesseract.image_to_string(image, lang='por')
+
+
+def _ocr_page_tesserocr(image) -> str:
+    """OCR one page image with a pooled tesserocr handle.
+    
+    Falls back to pytesseract for this and every later page if a handle
+    cannot be created, e.g. when tessdata or the language pack is missing.
+    
+    Args:
+        image: PIL image of the page
+    
+    Returns:
+        Recognized page text
+    """
+    global _tesserocr_init_error
+    if _tesserocr_init_error is not None:
+        return _ocr_page_pytesseract(image)
+    
+    try:
+        api = _tesserocr_apis.get_nowait()
+    except queue.Empty:
+        try:
+            import tesserocr
+            api = tesserocr.PyTessBaseAPI(lang='por')
+        except Exception as e:
+            _tesserocr_init_error = e
+            logging.warning("⚠️ tesserocr initialization failed, falling back to pytesseract: %s", e)
+            return _ocr_page_pytesseract(image)
+    try:
+        api.SetImage(image)
+        return api.GetUTF8Text()
+    finally:
+        _tesserocr_apis.put(api)
+
+
+def _end_tesserocr_apis() -> None:
+    """Release the pooled tesserocr handles at interpreter exit."""
+    while True:
+        try:
+            api = _tesserocr_apis.get_nowait()
+        except queue.Empty:
+            return
+        api.End()
+
+
+atexit.register(_end_tesserocr_apis)
 
 
 class TextExtractor:
@@ -31,6 +234,7 @@ class TextExtractor:
     
     def __init__(self, extractor_lib: str = "pymupdf"):
         self.extractor_lib = extractor_lib.lower()
+        _check_libraries()
         
         if self.extractor_lib == "pymupdf" and not PYMUPDF_AVAILABLE:
             raise ImportError("PyMuPDF not available")
@@ -38,66 +242,97 @@ class TextExtractor:
             raise ImportError("Pytesseract not available")
     
     def extract_text(self, pdf_path: str, max_length: int = 50000) -> str:
-        """Extract text from PDF using the specified library."""
+        """Extract text from PDF using the specified library.
+        
+        The text of an unchanged file is served from a cache, so retries of
+        the same PDF do not extract it again; failures are not cached.
+        """
         if self.extractor_lib == "pymupdf":
-            return self._extract_with_pymupdf(pdf_path, max_length)
+            library_name = "PyMuPDF"
         elif self.extractor_lib == "pytesseract":
-            return self._extract_with_pytesseract(pdf_path, max_length)
+            library_name = "Pytesseract"
         else:
             raise ValueError(f"Unsupported extractor library: {self.extractor_lib}")
+        
+        try:
+            file_stat = os.stat(pdf_path)
+            return _extract_text_cached(self.extractor_lib, pdf_path, file_stat.st_mtime_ns, file_stat.st_size, max_length)
+        except Exception as e:
+            logging.error("%s extraction error for %s: %s", library_name, pdf_path, e)
+            return ""
     
     def _extract_with_pymupdf(self, pdf_path: str, max_length: int) -> str:
         """Extract text using PyMuPDF."""
-        try:
-            doc = fitz.open(pdf_path)
-            text = ""
-            
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                page_text = page.get_text()
-                text += page_text + "\n"
+        import fitz
+        # Plain text with ligatures expanded to ASCII letters; _clean_text would drop them otherwise
+        text_flags = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+        
+        # Collect pages and join once, instead of re-copying the text per page
+        page_texts = []
+        total_length = 0
+        
+        with fitz.open(pdf_path, filetype='pdf') as doc:
+            for page in doc:
+                page_text = page.get_text("text", flags=text_flags)
+                page_texts.append(page_text)
+                total_length += len(page_text) + 1
                 
-                # Check if we've exceeded max length
-                if len(text) > max_length:
-                    text = text[:max_length]
+                # Stop before loading the next page once we've exceeded max length
+                if total_length > max_length:
                     break
-            
-            doc.close()
-            return self._clean_text(text)
-            
-        except Exception as e:
-            logging.error(f"PyMuPDF extraction error for {pdf_path}: {e}")
-            return ""
+        
+        text = "".join(page_text + "\n" for page_text in page_texts)[:max_length]
+        return self._clean_text(text)
     
     def _extract_with_pytesseract(self, pdf_path: str, max_length: int) -> str:
-        """Extract text using Pytesseract OCR."""
-        try:
-            # Convert PDF to images
-            images = pdf2image.convert_from_path(pdf_path)
-            text = ""
-            
-            for i, image in enumerate(images):
-                # Extract text from image using OCR
-                page_text = pytesseract.image_to_string(image, lang='por')
-                text += page_text + "\n"
-                
-                # Check if we've exceeded max length
-                if len(text) > max_length:
-                    text = text[:max_length]
-                    break
-            
-            return self._clean_text(text)
-            
-        except Exception as e:
-            logging.error(f"Pytesseract extraction error for {pdf_path}: {e}")
-            return ""
+        """Extract text using Pytesseract OCR, running the pages in parallel."""
+        import pdf2image
+        
+        # Files are already processed in parallel, so each document only gets
+        # OCR_PAGE_WORKERS rather than one worker per core
+        workers = max(1, OCR_PAGE_WORKERS)
+        # Convert PDF to images
+        images = pdf2image.convert_from_path(pdf_path, thread_count=workers)
+        page_texts = []
+        total_length = 0
+        
+        # tesserocr releases the GIL while recognizing and pytesseract runs a
+        # tesseract process per page, so threads are enough; results come back
+        # in page order
+        if TESSEROCR_AVAILABLE:
+            ocr_page = _ocr_page_tesserocr
+        else:
+            ocr_page = _ocr_page_pytesseract
+        if CV2_AVAILABLE and OCR_PREPROCESS_IMAGES:
+            ocr_page = functools.partial(_ocr_preprocessed_page, ocr_page)
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(images)))) as executor:
+            futures = [executor.submit(ocr_page, image) for image in images]
+            try:
+                for future in futures:
+                    page_text = future.result()
+                    page_texts.append(page_text)
+                    total_length += len(page_text) + 1
+                    
+                    # Check if we've exceeded max length
+                    if total_length > max_length:
+                        break
+            finally:
+                # Pages not started yet are dropped on early exit or error
+                executor.shutdown(cancel_futures=True)
+        
+        text = "".join(page_text + "\n" for page_text in page_texts)[:max_length]
+        return self._clean_text(text)
     
     def _clean_text(self, text: str) -> str:
         """Clean extracted text for LLM processing."""
         # Remove excessive whitespace, newlines, and control characters
-        text = re.sub(r'\s+', ' ', text).strip()
-        # Remove non-printable ASCII characters
-        text = ''.join(char for char in text if 31 < ord(char) < 127 or ord(char) in [10, 13])
+        text = _WHITESPACE_RE.sub(' ', text).strip()
+        # Remove non-ASCII, then non-printable ASCII characters, both in C; the
+        # isascii (constant time) and isprintable checks skip copying clean text
+        if not text.isascii():
+            text = text.encode('ascii', 'ignore').decode('ascii')
+        if not text.isprintable():
+            text = text.translate(_CONTROL_CHARS_TABLE)
         return text
     
     def extract_metadata(self, pdf_path: str) -> Dict[str, Any]:
@@ -109,12 +344,13 @@ class TextExtractor:
                 # For pytesseract, we can't extract metadata easily
                 return {"pages": 0, "size_mb": 0}
         except Exception as e:
-            logging.error(f"Metadata extraction error for {pdf_path}: {e}")
+            logging.error("Metadata extraction error for %s: %s", pdf_path, e)
             return {"pages": 0, "size_mb": 0}
     
     def _extract_metadata_pymupdf(self, pdf_path: str) -> Dict[str, Any]:
         """Extract metadata using PyMuPDF."""
         try:
+            import fitz
             doc = fitz.open(pdf_path)
             metadata = {
                 "pages": len(doc),
@@ -127,48 +363,74 @@ class TextExtractor:
             doc.close()
             return metadata
         except Exception as e:
-            logging.error(f"PyMuPDF metadata extraction error: {e}")
+            logging.error("PyMuPDF metadata extraction error: %s", e)
             return {"pages": 0, "size_mb": 0}
 
 
+@functools.lru_cache(maxsize=256)
+def _extract_text_cached(extractor_lib: str, pdf_path: str, mtime_ns: int, size: int, max_length: int) -> str:
+    """Extract text once per (library, path, modification time, size, max length).
+    
+    A changed file gets a new mtime/size and misses the cache. Exceptions are
+    not cached, so a failed extraction is attempted again on the next call.
+    The key holds no extractor, so cached entries do not keep one alive;
+    extractors keep no per-instance state, so a fresh one does the work.
+    
+    Args:
+        extractor_lib: Extraction library, "pymupdf" or "pytesseract"
+        pdf_path: Path to the PDF file
+        mtime_ns: Modification time of the file in nanoseconds, part of the cache key
+        size: Size of the file in bytes, part of the cache key
+        max_length: Maximum length of the extracted text
+    
+    Returns:
+        Cleaned text of the PDF
+    """
+    extractor = TextExtractor(extractor_lib)
+    if extractor_lib == "pymupdf":
+        return extractor._extract_with_pymupdf(pdf_path, max_length)
+    return extractor._extract_with_pytesseract(pdf_path, max_length)
+
+
 class RegexExtractor:
     """Extract specific fields using regex patterns."""
     
     @staticmethod
     def extract_doc_type(text: str) -> Optional[str]:
         """Extract document type using regex."""
-        text_upper = text.upper()
+        if AHOCORASICK_AVAILABLE:
+            # One pass for all indicators; keep scanning past parts matches for a service one
+            doc_type = "Outros"
+            for _, indicator_type in _DOC_TYPE_AUTOMATON.iter(text.casefold()):
+                if indicator_type == "Serviço":
+                    return indicator_type
+                doc_type = indicator_type
+            return doc_type
         
         # Check for service indicators
-        service_indicators = ["NFS-E", "NFSE", "NOTA FISCAL ELETRÔNICA DE SERVIÇOS", "TOMADOR DE SERVIÇOS"]
-        for indicator in service_indicators:
-            if indicator in text_upper:
-                return "Serviço"
+        if _SERVICE_RE.search(text):
+            return "Serviço"
         
         # Check for parts indicators
-        if "NF-E" in text_upper:
+        if _PARTS_RE.search(text):
             return "Peças"
         
         return "Outros"
     
     @staticmethod
     def extract_claim_number(text: str) -> Optional[str]:
-        pattern = r''
-        match = re.search(pattern, text)
+        match = _CLAIM_NUMBER_RE.search(text)
         return match.group(0) if match else None
     
     @staticmethod
     def extract_chassi(text: str) -> Optional[str]:
-        pattern = r''
-        match = re.search(pattern, text)
+        match = _CHASSI_RE.search(text)
         return match.group(0) if match else None
     
     @staticmethod
     def extract_cnpj(text: str) -> Optional[str]:
         """Extract CNPJ using regex."""
-        # Pattern for CNPJ format XX.XXX.XXX/XXXX-XX
-        pattern = r'\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}'
-        match = re.search(pattern, text)
+        match = _CNPJ_RE.search(text)
         return match.group(0) if match else None
     
     @staticmethod
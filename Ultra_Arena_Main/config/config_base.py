@@ -6,6 +6,8 @@ minimizing code duplication. It also contains the only SYSTEM_PROMPT and USER_PR
 for use as examples or tests with the top-level run_batch_processing() function.
 """
 
+from types import MappingProxyType
+
 # =============================================================================
 # BASE CONFIGURATION CONSTANTS (imported by other config files)
 # =============================================================================
@@ -122,6 +124,11 @@ MODE_BATCH_PARALLEL = "parallel"
 MAX_TOKENS_PER_REQUEST = 50000
 MAX_FILE_SIZE_MB = 10  # Maximum file size in MB for direct upload
 
+# File fingerprint hash written to the result CSVs: "md5", "blake3" or "xxh3_128".
+# blake3 and xxh3_128 are much faster but need the optional blake3/xxhash packages;
+# without them the fingerprint falls back to md5.
+FILE_HASH_ALGO = "md5"
+
 # Retry Configuration 
 # - infrastructure: Retries for API/network failures (timeouts, connection errors, etc.)
 API_INFRA_MAX_RETRIES = 3
@@ -197,103 +204,11 @@ MANDATORY_KEYS = []
 DIRECT_FILE_MAX_RETRIES = 2  # Maximum retry rounds for failed files
 DIRECT_FILE_RETRY_DELAY_SECONDS = 1  # Delay between retry rounds
 
-# Provider-specific settings for direct file processing
+# Default settings per provider; the strategy tables below pick providers from
+# here and override only what differs
 # NOTE: For Google GenAI, use gemini-2.5-flash to avoid 400 INVALID_ARGUMENT errors
 # Experimental models may not support all API parameters like response_mime_type
-DIRECT_FILE_PROVIDER_CONFIGS = {
-    "google": {
-        "api_key": GCP_API_KEY,
-        "model": GOOGLE_DEFAULT_MODEL_ID,
-        "temperature": GOOGLE_MODEL_TEMPERATURE,
-        "max_tokens": 4000,
-        "timeout": 60
-    },
-    "openai": {
-        "api_key": OPENAI_API_KEY,
-        "model": OPENAI_DEFAULT_MODEL_ID,
-        "temperature": OPENAI_MODEL_TEMPERATURE,
-        "max_tokens": 4000,
-        "timeout": 60
-    },
-    "deepseek": {
-        "api_key": DEEPSEEK_API_KEY,
-        "model": DEEPSEEK_DEFAULT_MODEL_ID,
-        "temperature": DEEPSEEK_MODEL_TEMPERATURE,
-        "max_tokens": 4000,
-        "timeout": 60
-    },
-    "claude": {
-        "api_key": CLAUDE_API_KEY,
-        "model": CLAUDE_DEFAULT_MODEL_ID,
-        "temperature": CLAUDE_MODEL_TEMPERATURE,
-        "max_tokens": 10000,
-        "timeout": 60
-    }
-}
-
-# ============================================================================
-# TEXT FIRST STRATEGY CONFIGURATIONS
-# ============================================================================
-
-# LLM Provider Configuration
-LOCAL_LLM_PROVIDER = "ollama"  # "ollama", "google", "openai", "deepseek"
-
-# PDF Text Extraction Configuration
-PDF_EXTRACTOR_LIB = "pymupdf"  # "pymupdf" or "pytesseract"
-SECONDARY_PDF_EXTRACTOR_LIB = "pytesseract"  # Secondary extractor for fallback
-
-# Text First Strategy Regex Criteria for validation
-TEXT_FIRST_REGEX_CRITERIA = {}
-
-# Provider-specific settings for text processing
-TEXT_PROVIDER_CONFIGS = {
-    "ollama": {
-        "model": LOCAL_OLLAMA_MODEL_DEEP_R1,
-        "temperature": LOCAL_OLLAMA_TEMPERATURE,
-        "max_tokens": LOCAL_OLLAMA_MAX_TOKENS,
-        "timeout": LOCAL_OLLAMA_TIMEOUT
-    },
-    "google": {
-        "api_key": GCP_API_KEY,
-        "model": GOOGLE_DEFAULT_MODEL_ID,
-        "temperature": GOOGLE_MODEL_TEMPERATURE,
-        "max_tokens": 4000,
-        "timeout": 60
-    },
-    "openai": {
-        "api_key": OPENAI_API_KEY,
-        "model": OPENAI_DEFAULT_MODEL_ID,
-        "temperature": OPENAI_MODEL_TEMPERATURE,
-        "max_tokens": 4000,
-        "timeout": 60
-    },
-    "deepseek": {
-        "api_key": DEEPSEEK_API_KEY,
-        "model": DEEPSEEK_DEFAULT_MODEL_ID,
-        "temperature": DEEPSEEK_MODEL_TEMPERATURE,
-        "max_tokens": 4000,
-        "timeout": 60
-    },
-    "claude": {
-        "api_key": CLAUDE_API_KEY,
-        "model": CLAUDE_DEFAULT_MODEL_ID,
-        "temperature": CLAUDE_MODEL_TEMPERATURE,
-        "max_tokens": 10000,
-        "timeout": 60
-    }
-}
-
-# ============================================================================
-# IMAGE FIRST STRATEGY CONFIGURATIONS
-# ============================================================================
-
-# PDF to Image Conversion Configuration
-PDF_TO_IMAGE_DPI = 300  # DPI for image conversion
-PDF_TO_IMAGE_FORMAT = "PNG"  # Output image format
-PDF_TO_IMAGE_QUALITY = 95  # Image quality (for JPEG)
-
-# Provider-specific settings for image processing
-IMAGE_PROVIDER_CONFIGS = {
+_BASE_PROVIDER_CONFIGS = {
     "ollama": {
         "model": LOCAL_OLLAMA_MODEL_DEEP_R1,
         "temperature": LOCAL_OLLAMA_TEMPERATURE,
@@ -351,6 +266,60 @@ IMAGE_PROVIDER_CONFIGS = {
     }
 }
 
+
+def _provider_config(provider: str, **overrides) -> MappingProxyType:
+    """Read-only settings for a provider from _BASE_PROVIDER_CONFIGS, with overrides applied."""
+    return MappingProxyType({**_BASE_PROVIDER_CONFIGS[provider], **overrides})
+
+
+def _provider_configs(*providers: str) -> MappingProxyType:
+    """Read-only table of the default settings for the given providers, in order."""
+    return MappingProxyType({provider: _provider_config(provider) for provider in providers})
+
+
+# Provider configs below are read-only views shared by every request; copy them
+# (see get_config_for_strategy in main_modular.py) before changing any values
+# Provider-specific settings for direct file processing
+DIRECT_FILE_PROVIDER_CONFIGS = _provider_configs("google", "openai", "deepseek", "claude")
+
+# ============================================================================
+# TEXT FIRST STRATEGY CONFIGURATIONS
+# ============================================================================
+
+# LLM Provider Configuration
+LOCAL_LLM_PROVIDER = "ollama"  # "ollama", "google", "openai", "deepseek"
+
+# PDF Text Extraction Configuration
+PDF_EXTRACTOR_LIB = "pymupdf"  # "pymupdf" or "pytesseract"
+SECONDARY_PDF_EXTRACTOR_LIB = "pytesseract"  # Secondary extractor for fallback
+# Opt-in: denoise, grayscale and Otsu-threshold page images before OCR (needs opencv-python).
+# Slower per page and changes the OCR text, so extraction results differ from plain OCR
+OCR_PREPROCESS_IMAGES = False
+# Pages of one document rendered and OCR'd at a time. Files are already processed
+# in parallel, so total OCR processes are about max_workers * OCR_PAGE_WORKERS
+# (tesseract can add OpenMP threads each; set OMP_THREAD_LIMIT=1 to pin them)
+OCR_PAGE_WORKERS = 2
+
+# Text First Strategy Regex Criteria for validation
+TEXT_FIRST_REGEX_CRITERIA = {}
+
+# Provider-specific settings for text processing
+TEXT_PROVIDER_CONFIGS = _provider_configs("ollama", "google", "openai", "deepseek", "claude")
+
+# ============================================================================
+# IMAGE FIRST STRATEGY CONFIGURATIONS
+# ============================================================================
+
+# PDF to Image Conversion Configuration
+PDF_TO_IMAGE_DPI = 300  # DPI for image conversion
+PDF_TO_IMAGE_FORMAT = "PNG"  # Output image format
+PDF_TO_IMAGE_QUALITY = 95  # Image quality (for JPEG)
+
+# Provider-specific settings for image processing
+IMAGE_PROVIDER_CONFIGS = _provider_configs(
+    "ollama", "google", "openai", "deepseek", "claude", "huggingface", "togetherai", "grok"
+)
+
 # ============================================================================
 # HUGGINGFACE STRATEGY CONFIGURATIONS
 # ============================================================================
@@ -365,19 +334,7 @@ HUGGINGFACE_PROVIDER_CONFIG = {
 }
 
 # Model-specific configurations for HuggingFace
-HUGGINGFACE_MODEL_CONFIGS = {
-    HUGGINGFACE_MODEL_ID_QWEN2_VL_72B: {
-        "api_key": HUGGINGFACE_TOKEN,
-        "model": HUGGINGFACE_MODEL_ID_QWEN2_VL_72B,
-        "temperature": HUGGINGFACE_MODEL_TEMPERATURE,
-        "max_tokens": 24000,
-        "timeout": 60
-    },
-    HUGGINGFACE_MODEL_ID_LLAMA_VISION_90B: {
-        "api_key": HUGGINGFACE_TOKEN,
-        "model": HUGGINGFACE_MODEL_ID_LLAMA_VISION_90B,
-        "temperature": HUGGINGFACE_MODEL_TEMPERATURE,
-        "max_tokens": 24000,
-        "timeout": 60
-    }
-}
+HUGGINGFACE_MODEL_CONFIGS = MappingProxyType({
+    model_id: _provider_config("huggingface", model=model_id, max_tokens=24000)
+    for model_id in (HUGGINGFACE_MODEL_ID_QWEN2_VL_72B, HUGGINGFACE_MODEL_ID_LLAMA_VISION_90B)
+})
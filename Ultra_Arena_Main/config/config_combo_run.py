@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from .config_param_grps import param_grps
 
 # Centralized combo configurations
@@ -251,3 +253,9 @@ combo_config = {
         ]
     }
 }
+
+# Freeze the strategy group lists into tuples and the combo table into a
+# read-only view; every run shares them, so nothing may modify them in place
+for _combo in combo_config.values():
+    _combo["strategy_groups"] = tuple(_combo["strategy_groups"])
+combo_config = MappingProxyType(combo_config)
@@ -1,5 +1,24 @@
+from types import MappingProxyType
+
 from config import config_base
 
+# Interned parameter groups keyed by their items, so identical groups share one object
+_param_grp_cache = {}
+
+
+def _intern_param_grp(params):
+    """
+    Return the shared read-only view for a parameter group.
+    
+    Args:
+        params: Parameter group dictionary
+        
+    Returns:
+        Read-only mapping shared by every group with the same items
+    """
+    return _param_grp_cache.setdefault(frozenset(params.items()), MappingProxyType(params))
+
+
 param_grps = {
     "grp_textF_ollama_deepR1_para" : {
         "strategy": config_base.STRATEGY_TEXT_FIRST,
@@ -175,4 +194,7 @@ param_grps = {
         "temperature": config_base.GROK_MODEL_TEMPERATURE
     }
 
-}
\ No newline at end of file
+}
+
+# Intern every group once at import; runs share them, so nothing may modify them in place
+param_grps = {name: _intern_param_grp(params) for name, params in param_grps.items()}
@@ -3,10 +3,26 @@ LLM client package for multiple provider support.
 """
 
 from .llm_client_base import BaseLLMClient
-from .llm_client_factory import LLMClientFactory
 
 # Export main classes
 __all__ = [
     'BaseLLMClient',
     'LLMClientFactory'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """
+    Import LLMClientFactory on first access, since it pulls in every provider SDK.
+    
+    Args:
+        name: Attribute name being looked up on the package
+        
+    Returns:
+        The requested attribute
+    """
+    if name == 'LLMClientFactory':
+        from .llm_client_factory import LLMClientFactory
+        globals()['LLMClientFactory'] = LLMClientFactory
+        return LLMClientFactory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
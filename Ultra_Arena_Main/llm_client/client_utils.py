@@ -2,6 +2,42 @@
 Utility functions for LLM clients to handle common operations like filename embedding.
 """
 
+import base64
+import functools
+import operator
+
+# Enhanced prompt templates, filled with str.format_map; literal JSON braces are doubled
+_FILENAME_EMBEDDED_PROMPT_TEMPLATE = (
+    "{user_prompt}\n\n"
+    "Analyze each uploaded {file_type} and return a JSON array. "
+    "For each file, look for the filename markers (=== FILE: ... ===) and include "
+    "that EXACT filename in your response. Each object MUST include a 'file_name_llm' field "
+    "that matches the filename from the markers. Example format:\n"
+    "[\n"
+    "    {{\n"
+    '        "file_name_llm": "{example_filename}",\n'
+    '        "...": "...",\n'
+    "    }}\n"
+    "]"
+)
+
+_TEXT_FIRST_PROMPT_TEMPLATE = (
+    "{user_prompt}\n\n"
+    "Analyze each text block and return a JSON array. "
+    "For each text block, look for the filename markers (=== FILE: ... ===) and include "
+    "that EXACT filename in your response. Each object MUST include a 'file_name_llm' field "
+    "that matches the filename from the markers. Example format:\n"
+    "[\n"
+    "    {{\n"
+    '        "file_name_llm": "{example_filename}",\n'
+    '        "...": "...",\n'
+    "    }}\n"
+    "]"
+)
+
+
+# Prompts are rebuilt for every batch from the same few (prompt, file type, example) inputs
+@functools.lru_cache(maxsize=256)
 def _create_filename_embedded_prompt(user_prompt, file_type="file", example_filename=None):
     """Create an enhanced prompt with filename embedding instructions.
     
@@ -16,21 +52,13 @@ def _create_filename_embedded_prompt(user_prompt, file_type="file", example_file
     if example_filename is None:
         example_filename = f"document1.{'png' if file_type == 'image' else 'pdf'}"
     
-    enhanced_prompt = (
-        f"{user_prompt}\n\n"
-        f"Analyze each uploaded {file_type} and return a JSON array. "
-        "For each file, look for the filename markers (=== FILE: ... ===) and include "
-        "that EXACT filename in your response. Each object MUST include a 'file_name_llm' field "
-        "that matches the filename from the markers. Example format:\n"
-        "[\n"
-        "    {\n"
-        f'        "file_name_llm": "{example_filename}",\n'
-        '        "...": "...",\n'
-        "    }\n"
-        "]"
-    )
-    return enhanced_prompt
+    return _FILENAME_EMBEDDED_PROMPT_TEMPLATE.format_map({
+        "user_prompt": user_prompt,
+        "file_type": file_type,
+        "example_filename": example_filename,
+    })
 
+@functools.lru_cache(maxsize=256)
 def _create_text_first_prompt(user_prompt, example_filename=None):
     """Create an enhanced prompt for text-first strategy with text content embedding instructions.
     
@@ -44,20 +72,10 @@ def _create_text_first_prompt(user_prompt, example_filename=None):
     if example_filename is None:
         example_filename = "document1.pdf"
     
-    enhanced_prompt = (
-        f"{user_prompt}\n\n"
-        "Analyze each text block and return a JSON array. "
-        "For each text block, look for the filename markers (=== FILE: ... ===) and include "
-        "that EXACT filename in your response. Each object MUST include a 'file_name_llm' field "
-        "that matches the filename from the markers. Example format:\n"
-        "[\n"
-        "    {\n"
-        f'        "file_name_llm": "{example_filename}",\n'
-        '        "...": "...",\n'
-        "    }\n"
-        "]"
-    )
-    return enhanced_prompt
+    return _TEXT_FIRST_PROMPT_TEMPLATE.format_map({
+        "user_prompt": user_prompt,
+        "example_filename": example_filename,
+    })
 
 def create_text_first_content_parts(text_contents, original_filenames, system_prompt=None, user_prompt=""):
     """Create content parts for text-first strategy with embedded text content.
@@ -71,26 +89,25 @@ def create_text_first_content_parts(text_contents, original_filenames, system_pr
     Returns:
         List of content parts with embedded text content and filename markers
     """
-    parts = []
-    
-    # Add system prompt if provided
-    if system_prompt:
-        parts.append({"text": system_prompt})
-    
-    # Add enhanced user prompt with text content instructions
+    # Preallocate the parts: optional system prompt, enhanced prompt, then three per file
+    file_count = min(len(text_contents), len(original_filenames))
     enhanced_prompt = _create_text_first_prompt(user_prompt)
-    parts.append({"text": enhanced_prompt})
+    parts, offset = _start_content_parts(file_count, system_prompt, enhanced_prompt)
     
     # Add text contents with embedded filename markers
-    for text_content, original_filename in zip(text_contents, original_filenames):
+    for i in range(file_count):
+        original_filename = original_filenames[i]
+        text_content = text_contents[i]
+        start = offset + 3 * i
+        
         # Add start marker
-        parts.append({"text": f"=== FILE: {original_filename} ==="})
+        parts[start] = {"text": f"=== FILE: {original_filename} ==="}
         
         # Add the extracted text content
-        parts.append({"text": text_content})
+        parts[start + 1] = {"text": text_content}
         
         # Add end marker
-        parts.append({"text": f"=== END FILE: {original_filename} ==="})
+        parts[start + 2] = {"text": f"=== END FILE: {original_filename} ==="}
     
     return parts
 
@@ -99,6 +116,8 @@ def create_content_parts_with_embedded_names(files, original_filenames, system_p
                                            file_uri_getter=None, mime_type="image/png"):
     """Create content parts with embedded filenames for better LLM understanding.
     
+    Dispatches once to the image or file builder so neither loop branches per file.
+    
     Args:
         files: List of uploaded file objects (for PDFs) or file paths (for images)
         original_filenames: List of original filenames
@@ -111,41 +130,91 @@ def create_content_parts_with_embedded_names(files, original_filenames, system_p
     Returns:
         List of content parts with embedded filename markers
     """
-    parts = []
+    if is_image_mode:
+        return create_image_content_parts(files, original_filenames, system_prompt, user_prompt, mime_type)
+    return create_file_content_parts(files, original_filenames, system_prompt, user_prompt, file_uri_getter)
+
+def _start_content_parts(file_count, system_prompt, enhanced_prompt):
+    """Preallocate content parts and fill in the prompts ahead of the files.
+    
+    Args:
+        file_count: Number of files to embed, three parts each
+        system_prompt: Optional system prompt
+        enhanced_prompt: Enhanced user prompt with filename instructions
+    
+    Returns:
+        Tuple of (parts, offset), where offset is the index of the first file part
+    """
+    offset = 2 if system_prompt else 1
+    parts = [None] * (offset + 3 * file_count)
     
     # Add system prompt if provided
     if system_prompt:
-        parts.append({"text": system_prompt})
+        parts[0] = {"text": system_prompt}
     
-    # Determine file type for prompt
-    file_type = "image" if is_image_mode else "file"
-    example_filename = "document1.png" if is_image_mode else "document1.pdf"
+    parts[offset - 1] = {"text": enhanced_prompt}
+    return parts, offset
+
+def create_image_content_parts(image_paths, original_filenames, system_prompt=None, 
+                               user_prompt="", mime_type="image/png"):
+    """Create content parts with embedded filenames and inline base64 images.
     
-    # Add enhanced user prompt with filename instructions
-    enhanced_prompt = _create_filename_embedded_prompt(user_prompt, file_type, example_filename)
-    parts.append({"text": enhanced_prompt})
+    Args:
+        image_paths: List of image file paths
+        original_filenames: List of original filenames
+        system_prompt: Optional system prompt
+        user_prompt: User prompt
+        mime_type: MIME type for image files (default: "image/png")
+        
+    Returns:
+        List of content parts with embedded filename markers
+    """
+    file_count = min(len(image_paths), len(original_filenames))
+    enhanced_prompt = _create_filename_embedded_prompt(user_prompt, "image", "document1.png")
+    parts, offset = _start_content_parts(file_count, system_prompt, enhanced_prompt)
+    
+    # Add images with embedded filename markers
+    for i in range(file_count):
+        original_filename = original_filenames[i]
+        start = offset + 3 * i
+        
+        parts[start] = {"text": f"=== FILE: {original_filename} ==="}
+        # Read file and convert to base64
+        with open(image_paths[i], "rb") as img_file:
+            image_data = base64.b64encode(img_file.read()).decode('utf-8')
+        parts[start + 1] = {"inline_data": {"mime_type": mime_type, "data": image_data}}
+        parts[start + 2] = {"text": f"=== END FILE: {original_filename} ==="}
     
-    # Add files with embedded filename markers
-    for file_item, original_filename in zip(files, original_filenames):
-        # Add start marker
-        parts.append({"text": f"=== FILE: {original_filename} ==="})
+    return parts
+
+def create_file_content_parts(files, original_filenames, system_prompt=None, 
+                              user_prompt="", file_uri_getter=None):
+    """Create content parts with embedded filenames and uploaded file URIs.
+    
+    Args:
+        files: List of uploaded file objects
+        original_filenames: List of original filenames
+        system_prompt: Optional system prompt
+        user_prompt: User prompt
+        file_uri_getter: Function to get file URI from file object, defaults to its uri attribute
         
-        if is_image_mode:
-            # For images: read file and convert to base64
-            import base64
-            with open(file_item, "rb") as img_file:
-                image_data = base64.b64encode(img_file.read()).decode('utf-8')
-            parts.append({"inline_data": {"mime_type": mime_type, "data": image_data}})
-        else:
-            # For PDFs: use uploaded file URI
-            if file_uri_getter:
-                file_uri = file_uri_getter(file_item)
-            else:
-                # Default assumption for Google GenAI
-                file_uri = file_item.uri
-            parts.append({"file_data": {"file_uri": file_uri}})
+    Returns:
+        List of content parts with embedded filename markers
+    """
+    file_count = min(len(files), len(original_filenames))
+    enhanced_prompt = _create_filename_embedded_prompt(user_prompt, "file", "document1.pdf")
+    parts, offset = _start_content_parts(file_count, system_prompt, enhanced_prompt)
+    
+    # Default assumption for Google GenAI: uploaded files carry their URI
+    get_file_uri = file_uri_getter or operator.attrgetter("uri")
+    
+    # Add files with embedded filename markers
+    for i in range(file_count):
+        original_filename = original_filenames[i]
+        start = offset + 3 * i
         
-        # Add end marker
-        parts.append({"text": f"=== END FILE: {original_filename} ==="})
+        parts[start] = {"text": f"=== FILE: {original_filename} ==="}
+        parts[start + 1] = {"file_data": {"file_uri": get_file_uri(files[i])}}
+        parts[start + 2] = {"text": f"=== END FILE: {original_filename} ==="}
     
-    return parts 
\ No newline at end of file
+    return parts
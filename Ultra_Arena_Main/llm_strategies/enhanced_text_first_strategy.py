@@ -36,6 +36,13 @@ class EnhancedTextFirstProcessingStrategy(BaseProcessingStrategy):
         self.primary_extractor_lib = config.get("pdf_extractor_lib", "pymupdf")
         self.secondary_extractor_lib = config.get("secondary_pdf_extractor_lib", "pytesseract")
         self.regex_criteria = config.get("text_first_regex_criteria", {})
+        # Compile the criteria once, they are evaluated for every file and extractor
+        self.compiled_regex_criteria = {}
+        for field_name, regex_pattern in self.regex_criteria.items():
+            try:
+                self.compiled_regex_criteria[field_name] = re.compile(regex_pattern)
+            except Exception as e:
+                logging.error(f"❌ Regex compilation failed for {field_name}: {e}")
         
         # Initialize text extractors
         self.primary_extractor = TextExtractor(self.primary_extractor_lib)
@@ -209,9 +216,9 @@ class EnhancedTextFirstProcessingStrategy(BaseProcessingStrategy):
         successful_matches = 0
         match_details = []
         
-        for field_name, regex_pattern in self.regex_criteria.items():
+        for field_name, compiled_pattern in self.compiled_regex_criteria.items():
             try:
-                matches = re.findall(regex_pattern, text_content)
+                matches = compiled_pattern.findall(text_content)
                 if matches:
                     successful_matches += 1
                     match_details.append(f"{field_name}: {len(matches)} match(es)")
@@ -106,6 +106,11 @@ def generate_timestamped_filename(strategy: str, mode: str, llm_provider: str, l
     return f"{strategy}_{mode}_{llm_provider}_{clean_model}_{timestamp}.{extension}"
 
 
+def _copy_provider_configs(provider_configs: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Copy read-only provider configs from config_base into plain dicts this request can modify."""
+    return {provider: dict(provider_config) for provider, provider_config in provider_configs.items()}
+
+
 def get_config_for_strategy(strategy_type: str, llm_provider: str = None, llm_model: str = None, streaming: bool = False, output_dir: str = None) -> Dict[str, Any]:
     """
     Get configuration for a specific strategy type.
@@ -122,7 +127,7 @@ def get_config_for_strategy(strategy_type: str, llm_provider: str = None, llm_mo
     if strategy_type == STRATEGY_DIRECT_FILE:
         config = {
             "llm_provider": llm_provider or config_base.DEFAULT_LLM_PROVIDER,
-            "provider_configs": DIRECT_FILE_PROVIDER_CONFIGS,
+            "provider_configs": _copy_provider_configs(DIRECT_FILE_PROVIDER_CONFIGS),
             "mandatory_keys": config_base.MANDATORY_KEYS,
             "num_retry_for_mandatory_keys": config_base.NUM_RETRY_FOR_MANDATORY_KEYS,
             "max_num_files_per_request": config_base.MAX_NUM_FILES_PER_REQUEST,
@@ -162,7 +167,7 @@ def get_config_for_strategy(strategy_type: str, llm_provider: str = None, llm_mo
     elif strategy_type == STRATEGY_TEXT_FIRST:
         config = {
             "llm_provider": LOCAL_LLM_PROVIDER,
-            "provider_configs": TEXT_PROVIDER_CONFIGS,
+            "provider_configs": _copy_provider_configs(TEXT_PROVIDER_CONFIGS),
             "pdf_extractor_lib": PDF_EXTRACTOR_LIB,
             "secondary_pdf_extractor_lib": SECONDARY_PDF_EXTRACTOR_LIB,
             "text_first_regex_criteria": TEXT_FIRST_REGEX_CRITERIA,
@@ -195,7 +200,7 @@ def get_config_for_strategy(strategy_type: str, llm_provider: str = None, llm_mo
     elif strategy_type == STRATEGY_IMAGE_FIRST:
         config = {
             "llm_provider": llm_provider or config_base.DEFAULT_LLM_PROVIDER,
-            "provider_configs": IMAGE_PROVIDER_CONFIGS,
+            "provider_configs": _copy_provider_configs(IMAGE_PROVIDER_CONFIGS),
             "pdf_to_image_dpi": PDF_TO_IMAGE_DPI,
             "pdf_to_image_format": PDF_TO_IMAGE_FORMAT,
             "pdf_to_image_quality": PDF_TO_IMAGE_QUALITY,
@@ -602,9 +607,8 @@ def _run_combo_processing_parallel(benchmark_eval_mode: bool = False, combo_name
         request_metadata = RequestIDGenerator.create_request_metadata()
         request_id = request_metadata["request_id"]
         
-        # Create new timestamped results directory
-        results_dir = ComboMetaManager.create_results_directory(output_base_dir, request_id)
-        combo_csv_dir, combo_json_dir = ComboMetaManager.create_combo_directories(results_dir)
+        # Create new timestamped results directory with its csv and json subdirectories
+        results_dir, combo_csv_dir, combo_json_dir = ComboMetaManager.create_combo_layout(output_base_dir, request_id)
         
         # Create combo_meta.json file
         ComboMetaManager.create_combo_meta_file(
@@ -721,7 +725,7 @@ def _process_single_strategy(group_name: str, group_params: Dict, combo_name: st
                            json_filename: str = None, csv_filename: str = None) -> Dict[str, Any]:
     """Process a single strategy within a combo run."""
     logging.info(f"⚙️ Processing parameter group: {group_name}")
-    logging.info(f"📋 Parameters: {group_params}")
+    logging.info(f"📋 Parameters: {dict(group_params)}")
     
     # Extract parameters
     strategy = group_params.get("strategy", STRATEGY_DIRECT_FILE)
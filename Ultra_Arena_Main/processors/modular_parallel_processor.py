@@ -199,51 +199,56 @@ class ModularParallelProcessor:
         for i, group in enumerate(file_groups):
             logging.info(f"   Group {i}: {len(group)} files")
         
-        # Process groups
-        logging.info("🔄 Starting group processing...")
-        file_dict_for_retries = {}
-        lot_timestamp_hash = str(int(time.time()))
-        
-        if self.mode == MODE_PARALLEL:
-            logging.info("🔄 Processing groups in parallel mode...")
-            results = self._process_groups_parallel(file_groups=file_groups, user_prompt=user_prompt, system_prompt=system_prompt, lot_timestamp_hash=lot_timestamp_hash, file_dict_for_retries=file_dict_for_retries)
-        else:
-            logging.info("🔄 Processing groups in batch mode...")
-            results = self._process_groups_batch(file_groups=file_groups, user_prompt=user_prompt, system_prompt=system_prompt, lot_timestamp_hash=lot_timestamp_hash, file_dict_for_retries=file_dict_for_retries)
-        
-        logging.info(f"✅ Group processing completed, got {len(results)} results")
-        
-        # Process retries if needed
-        if file_dict_for_retries:
-            logging.info(f"🔄 Processing {len(file_dict_for_retries)} files that need retry...")
-            self._process_retries(file_dict_for_retries=file_dict_for_retries, user_prompt=user_prompt, system_prompt=system_prompt, lot_timestamp_hash=lot_timestamp_hash)
-        else:
-            logging.info("✅ No files need retry")
-        
-        # Calculate final statistics
-        logging.info("📊 Calculating final statistics...")
-        self._calculate_final_statistics(start_time)
-        
-        # Check benchmark errors for all processed files after all processing is complete
-        # This includes both successful and failed files
-        if self.benchmark_comparator:
-            logging.info("🔍 Checking benchmark errors for all processed files...")
-            for file_path in self.structured_output.get('file_stats', {}):
-                if file_path in self.structured_output['file_stats']:
-                    result = self.structured_output['file_stats'][file_path]
-                    self.check_file_benchmark_errors(file_path, result)
+        # Compact and close the results CSV even if processing fails, so rows
+        # replaced by retries never stay in the file
+        try:
+            # Process groups
+            logging.info("🔄 Starting group processing...")
+            file_dict_for_retries = {}
+            lot_timestamp_hash = str(int(time.time()))
             
-            # Update benchmark error statistics after comparison is complete
-            error_stats = self.benchmark_tracker.get_error_stats()
-            benchmark_errors = {
-                'total_unmatched_fields': error_stats.get('total_unmatched_fields', 0),
-                'total_unmatched_files': error_stats.get('total_unmatched_files', 0)
-            }
-            self.set_benchmark_errors(benchmark_errors)
-        
-        # Save results
-        logging.info("💾 Saving results...")
-        self.save_results()
+            if self.mode == MODE_PARALLEL:
+                logging.info("🔄 Processing groups in parallel mode...")
+                results = self._process_groups_parallel(file_groups=file_groups, user_prompt=user_prompt, system_prompt=system_prompt, lot_timestamp_hash=lot_timestamp_hash, file_dict_for_retries=file_dict_for_retries)
+            else:
+                logging.info("🔄 Processing groups in batch mode...")
+                results = self._process_groups_batch(file_groups=file_groups, user_prompt=user_prompt, system_prompt=system_prompt, lot_timestamp_hash=lot_timestamp_hash, file_dict_for_retries=file_dict_for_retries)
+            
+            logging.info(f"✅ Group processing completed, got {len(results)} results")
+            
+            # Process retries if needed
+            if file_dict_for_retries:
+                logging.info(f"🔄 Processing {len(file_dict_for_retries)} files that need retry...")
+                self._process_retries(file_dict_for_retries=file_dict_for_retries, user_prompt=user_prompt, system_prompt=system_prompt, lot_timestamp_hash=lot_timestamp_hash)
+            else:
+                logging.info("✅ No files need retry")
+            
+            # Calculate final statistics
+            logging.info("📊 Calculating final statistics...")
+            self._calculate_final_statistics(start_time)
+            
+            # Check benchmark errors for all processed files after all processing is complete
+            # This includes both successful and failed files
+            if self.benchmark_comparator:
+                logging.info("🔍 Checking benchmark errors for all processed files...")
+                for file_path in self.structured_output.get('file_stats', {}):
+                    if file_path in self.structured_output['file_stats']:
+                        result = self.structured_output['file_stats'][file_path]
+                        self.check_file_benchmark_errors(file_path, result)
+            
+                # Update benchmark error statistics after comparison is complete
+                error_stats = self.benchmark_tracker.get_error_stats()
+                benchmark_errors = {
+                    'total_unmatched_fields': error_stats.get('total_unmatched_fields', 0),
+                    'total_unmatched_files': error_stats.get('total_unmatched_files', 0)
+                }
+                self.set_benchmark_errors(benchmark_errors)
+            
+            # Save results
+            logging.info("💾 Saving results...")
+            self.save_results()
+        finally:
+            self.csv_dumper.close()
         
         logging.info(f"🎉 Processing complete! Total time: {time.time() - start_time:.2f}s")
         return self.structured_output
@@ -1742,6 +1747,9 @@ class ModularParallelProcessor:
     def save_results(self):
         """Save final results to file."""
         try:
+            # Finish the CSV, dropping rows that retries replaced
+            self.csv_dumper.close()
+            
             with open(self.output_file, 'w', encoding='utf-8') as f:
                 json.dump(self.structured_output, f, indent=2, ensure_ascii=False)
             logging.info(f"💾 Results saved to {self.output_file}")
@@ -0,0 +1,27 @@
+"""
+Shared pytest setup for the Ultra Arena Main unit tests.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+# Add the Ultra_Arena_Main to the Python path
+ultra_arena_main_path = Path(__file__).parent.parent
+sys.path.insert(0, str(ultra_arena_main_path))
+
+
+@pytest.fixture
+def benchmark_xlsx(tmp_path):
+    """Write a small benchmark workbook with numeric text, blank and mixed cells."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(['file_path', 'CNPJ', 'VALOR', 'NOME'])
+    sheet.append(['docs/a.pdf', '11', 10.0, 'ACME'])
+    sheet.append(['docs/b.pdf', ' 22 ', 10.5, None])
+    sheet.append(['docs/c.pdf', None, 3, 'None'])
+    path = tmp_path / 'benchmark.xlsx'
+    workbook.save(path)
+    return str(path)
@@ -0,0 +1,40 @@
+"""
+Tests for loading and sharing the benchmark index.
+"""
+
+import pandas as pd
+
+from benchmark.benchmark_validator import BenchmarkValidator
+from common.benchmark_comparator import BenchmarkComparator
+from common.benchmark_index import BenchmarkIndex, read_benchmark_file
+
+
+def test_xlsx_loader_matches_read_excel(benchmark_xlsx):
+    """Numeric text such as '11' and ' 22 ' is inferred exactly as pandas.read_excel does."""
+    expected = pd.read_excel(benchmark_xlsx)
+    
+    benchmark_data = read_benchmark_file(benchmark_xlsx)
+    
+    pd.testing.assert_frame_equal(benchmark_data, expected)
+    assert benchmark_data['CNPJ'].tolist()[:2] == [11.0, 22.0]
+
+
+def test_index_values_match_read_excel_records(benchmark_xlsx):
+    """Indexed lookups return the values the old per-file DataFrame scan returned."""
+    index = BenchmarkIndex.from_file(benchmark_xlsx)
+    benchmark_data = pd.read_excel(benchmark_xlsx)
+    
+    for _, row in benchmark_data.iterrows():
+        for field_name in ['CNPJ', 'VALOR', 'NOME']:
+            expected = str(row[field_name]) if pd.notna(row[field_name]) else None
+            assert index.value(row['file_path'], field_name) == expected
+            assert index.value(row['file_path'], field_name, stripped=True) == (expected.strip() if expected else None)
+
+
+def test_validator_and_comparator_share_the_index(benchmark_xlsx):
+    """The unchanged benchmark file is parsed once and shared."""
+    validator = BenchmarkValidator(benchmark_xlsx, ['CNPJ'])
+    comparator = BenchmarkComparator(benchmark_xlsx)
+    
+    assert validator.benchmark_index is comparator.benchmark_index
+    assert comparator.get_benchmark_value('/in/b.pdf', 'CNPJ') == '22.0'
@@ -0,0 +1,181 @@
+"""
+Tests for BenchmarkManager batch validation, statistics and error spool.
+"""
+
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from benchmark import benchmark_manager
+from benchmark.benchmark_manager import BenchmarkManager
+from benchmark.benchmark_reporter import BenchmarkReporter, ERROR_CSV_FIELDS
+
+MANDATORY_KEYS = ['CNPJ', 'VALOR', 'NOME']
+
+FILE_RESULTS = {
+    '/in/a.pdf': {'DOC_TYPE': 'Nota', 'CNPJ': '11', 'VALOR': '10', 'NOME': 'ACME'},
+    '/in/b.pdf': {'DOC_TYPE': 'Nota', 'CNPJ': '22', 'VALOR': 10.5, 'NOME': None},
+    '/in/c.pdf': {'DOC_TYPE': 'Nota', 'CNPJ': 'Not found', 'VALOR': 3, 'NOME': 'None'},
+    '/in/d.pdf': {'DOC_TYPE': 'Outros'},
+    '/in/e.pdf': None,
+    '/in/unknown.pdf': {'DOC_TYPE': 'Nota', 'CNPJ': '11', 'VALOR': float('nan'), 'NOME': ['ACME']},
+}
+
+# Only ints and None, so an inferred column dtype would be float64
+INT_FILE_RESULTS = {
+    '/in/a.pdf': {'DOC_TYPE': 'Nota', 'CNPJ': 11, 'VALOR': 10, 'NOME': None},
+    '/in/b.pdf': {'DOC_TYPE': 'Nota', 'CNPJ': 22, 'VALOR': None, 'NOME': None},
+    '/in/c.pdf': {'DOC_TYPE': 'Nota', 'CNPJ': None, 'VALOR': 3, 'NOME': 1},
+}
+
+
+def manager_state(manager):
+    """Collect everything a batch validation leaves behind on the manager."""
+    return {
+        'errors': manager.get_benchmark_errors(),
+        'field_error_counts': dict(manager.field_error_counts),
+        'files_with_field_errors': manager.files_with_field_errors,
+        'unmatched_fields': manager.unmatched_fields_data,
+    }
+
+
+@pytest.mark.parametrize('file_results', [FILE_RESULTS, INT_FILE_RESULTS], ids=['mixed', 'ints'])
+@pytest.mark.parametrize('min_files', [1, len(FILE_RESULTS) + 1], ids=['vectorized', 'per_file'])
+def test_batch_validation_matches_per_file_path(benchmark_xlsx, monkeypatch, min_files, file_results):
+    """Both sides of the vectorized threshold give the per-file results and statistics."""
+    expected = BenchmarkManager(benchmark_xlsx, MANDATORY_KEYS)
+    expected_validations = {file_path: expected.validate_file_results(file_path, result)
+                            for file_path, result in file_results.items()}
+    
+    monkeypatch.setattr(benchmark_manager, 'VECTORIZED_VALIDATION_MIN_FILES', min_files)
+    manager = BenchmarkManager(benchmark_xlsx, MANDATORY_KEYS)
+    batch_results = manager.validate_batch_results(file_results)
+    
+    assert batch_results['file_results'] == expected_validations
+    assert batch_results['files_with_errors'] == sum(v['has_errors'] for v in expected_validations.values())
+    assert batch_results['total_unmatched_fields'] == expected.total_unmatched_fields
+    assert manager.unmatched_fields_data
+    assert manager_state(manager) == manager_state(expected)
+
+
+def test_cache_keeps_none_and_none_string_apart(benchmark_xlsx):
+    """None is a missing value while 'None' is compared, so they must not share a cached result."""
+    manager = BenchmarkManager(benchmark_xlsx, MANDATORY_KEYS)
+    missing = {'DOC_TYPE': 'Nota', 'CNPJ': '11', 'VALOR': 10, 'NOME': None}
+    literal = {'DOC_TYPE': 'Nota', 'CNPJ': '11', 'VALOR': 10, 'NOME': 'None'}
+    
+    assert manager.validate_file_results('/in/a.pdf', missing) == manager.validator.validate_single_file('/in/a.pdf', missing)
+    assert manager.validate_file_results('/in/a.pdf', literal) == manager.validator.validate_single_file('/in/a.pdf', literal)
+    assert manager.validate_file_results('/in/a.pdf', literal)['missing_keys'] == []
+
+
+def test_cache_hits_record_the_same_statistics(benchmark_xlsx):
+    """Validating the same extraction twice counts and spools it twice, as without the cache."""
+    cached = BenchmarkManager(benchmark_xlsx, MANDATORY_KEYS)
+    uncached = BenchmarkManager(benchmark_xlsx, MANDATORY_KEYS)
+    result = FILE_RESULTS['/in/b.pdf']
+    
+    for _ in range(2):
+        cached.validate_file_results('/in/b.pdf', result)
+        uncached._validation_cache.clear()
+        uncached.validate_file_results('/in/b.pdf', result)
+    
+    assert len(cached.unmatched_fields_data) == 2 * len(cached.validator.validate_single_file('/in/b.pdf', result)['field_errors'])
+    assert manager_state(cached) == manager_state(uncached)
+
+
+def test_error_csv_matches_dataframe_to_csv(benchmark_xlsx, tmp_path):
+    """The spooled error CSV is byte-identical to writing the rows with DataFrame.to_csv."""
+    file_results = {
+        '/in/a.pdf': {'DOC_TYPE': 'Nota', 'CNPJ': 'a,b', 'VALOR': 'say "hi"', 'NOME': 'line\nbreak'},
+        '/in/b.pdf': {'DOC_TYPE': 'Nota', 'CNPJ': 'ç', 'VALOR': 10.5, 'NOME': 'x'},
+        '/in/unknown.pdf': {'DOC_TYPE': 'Nota', 'CNPJ': '11', 'VALOR': '', 'NOME': 'x'},
+    }
+    manager = BenchmarkManager(benchmark_xlsx, MANDATORY_KEYS)
+    manager.validate_batch_results(file_results)
+    
+    rows = [
+        {'file_path': file_path, **field_error}
+        for file_path, result in file_results.items()
+        for field_error in manager.validator.validate_single_file(file_path, result)['field_errors']
+    ]
+    expected_path = tmp_path / 'expected.csv'
+    pd.DataFrame(rows, columns=ERROR_CSV_FIELDS).to_csv(expected_path, index=False, lineterminator='\n')
+    
+    csv_path = manager.generate_error_csv(str(tmp_path / 'results.csv'))
+    
+    assert csv_path == str(tmp_path / 'errors' / 'errors_results.csv')
+    assert Path(csv_path).read_bytes() == expected_path.read_bytes()
+
+
+def test_close_releases_the_error_spool(benchmark_xlsx):
+    """close() discards the spool; later errors start a new one."""
+    manager = BenchmarkManager(benchmark_xlsx, MANDATORY_KEYS)
+    manager.validate_file_results('/in/unknown.pdf', {'DOC_TYPE': 'Nota', 'CNPJ': '11'})
+    spool = manager._error_spool
+    
+    manager.close()
+    
+    assert spool.closed
+    assert manager.unmatched_fields_data == []
+
+
+def test_cached_results_are_not_shared_with_callers(benchmark_xlsx):
+    """Modifying a returned result does not change what later cache hits return."""
+    manager = BenchmarkManager(benchmark_xlsx, MANDATORY_KEYS)
+    result = FILE_RESULTS['/in/b.pdf']
+    expected = manager.validator.validate_single_file('/in/b.pdf', result)
+    
+    for _ in range(2):
+        validation = manager.validate_file_results('/in/b.pdf', result)
+        validation['missing_keys'].append('EXTRA')
+        validation['field_errors'].clear()
+    
+    assert manager.validate_file_results('/in/b.pdf', result) == expected
+
+
+def test_reports_recreate_a_removed_output_directory(benchmark_xlsx, tmp_path):
+    """Report directories deleted between runs are created again."""
+    manager = BenchmarkManager(benchmark_xlsx, MANDATORY_KEYS)
+    manager.validate_batch_results(FILE_RESULTS)
+    output_dir = tmp_path / 'out'
+    
+    for _ in range(2):
+        csv_path = manager.generate_error_csv(str(output_dir / 'results.csv'))
+        report_files = manager.generate_benchmark_report(str(output_dir / 'report'))
+        
+        assert Path(csv_path).exists()
+        assert report_files and all(Path(path).exists() for path in report_files.values())
+        shutil.rmtree(output_dir)
+
+
+def test_error_csv_still_accepts_a_list_of_rows(tmp_path):
+    """BenchmarkReporter.generate_error_csv keeps taking unmatched rows as a list of dicts."""
+    rows = [
+        {'file_path': '/in/a.pdf', 'field_name': 'CNPJ', 'benchmark_value': '11.0', 'extracted_value': '11',
+         'timestamp': '2024-01-01T00:00:00'},
+        {'file_path': '/in/b.pdf', 'field_name': 'NOME', 'benchmark_value': None, 'extracted_value': 'a,b',
+         'timestamp': '2024-01-01T00:00:01'},
+    ]
+    expected_path = tmp_path / 'expected.csv'
+    pd.DataFrame(rows).to_csv(expected_path, index=False, lineterminator='\n')
+    
+    csv_path = BenchmarkReporter().generate_error_csv(rows, str(tmp_path / 'results.csv'))
+    
+    assert Path(csv_path).read_bytes() == expected_path.read_bytes()
+    assert BenchmarkReporter().generate_error_csv([], str(tmp_path / 'empty.csv')) is None
+
+
+def test_unmatched_fields_data_is_assignable(benchmark_xlsx):
+    """Assigning unmatched_fields_data replaces the recorded rows, as with the former list attribute."""
+    manager = BenchmarkManager(benchmark_xlsx, MANDATORY_KEYS)
+    manager.validate_batch_results(FILE_RESULTS)
+    rows = [{'file_path': '/in/a.pdf', 'field_name': 'CNPJ', 'benchmark_value': None, 'extracted_value': '11'}]
+    
+    manager.unmatched_fields_data = rows
+    assert manager.unmatched_fields_data == rows
+    
+    manager.unmatched_fields_data = []
+    assert manager.unmatched_fields_data == []
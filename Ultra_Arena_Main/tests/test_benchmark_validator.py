@@ -0,0 +1,45 @@
+"""
+Tests for BenchmarkValidator.validate_many against the per-file validation path.
+"""
+
+from openpyxl import Workbook
+
+from benchmark.benchmark_validator import BenchmarkValidator
+
+
+def assert_same_as_single_file(validator, file_results):
+    """Check validate_many returns validate_single_file's result for every file, in order."""
+    validations = validator.validate_many(file_results)
+    
+    assert list(validations) == list(file_results)
+    for file_path, result in file_results.items():
+        assert validations[file_path] == validator.validate_single_file(file_path, result)
+
+
+def test_validate_many_without_mandatory_keys(benchmark_xlsx):
+    """Files produce no comparison records when there are no mandatory keys."""
+    validator = BenchmarkValidator(benchmark_xlsx, [])
+    file_results = {
+        '/in/a.pdf': {'DOC_TYPE': 'Nota', 'CNPJ': '11'},
+        '/in/b.pdf': {'DOC_TYPE': 'Outros'},
+        '/in/c.pdf': None,
+    }
+    
+    assert_same_as_single_file(validator, file_results)
+    assert validator.validate_many(file_results)['/in/a.pdf']['has_errors'] is False
+
+
+def test_validate_many_with_int_values(tmp_path):
+    """Int-only batches are not rendered through an inferred float column ('1.0' vs '1')."""
+    workbook = Workbook()
+    workbook.active.append(['file_path', 'A', 'B'])
+    workbook.active.append(['docs/a.pdf', '1', '7'])
+    workbook.active.append(['docs/b.pdf', '1', '7'])
+    benchmark_path = tmp_path / 'int_benchmark.xlsx'
+    workbook.save(benchmark_path)
+    validator = BenchmarkValidator(str(benchmark_path), ['A', 'B'])
+    
+    file_results = {'/x/a.pdf': {'A': 1, 'B': None}, '/x/b.pdf': {'A': 3.0, 'B': 7}}
+    
+    assert_same_as_single_file(validator, file_results)
+    assert validator.validate_many(file_results)['/x/b.pdf']['matching_keys'] == ['B']